@@ -0,0 +1,86 @@
+"""Count the commits and time common write patterns
+
+Each write method commits once, and writes grouped with
+DatabaseManager.transaction() or add_events_bulk commit once per group.
+This compares the grouped and ungrouped forms of the same work by
+counting the COMMIT statements the writer connection runs.
+
+    python benchmarks/commit_count.py --db /tmp/commits.db
+
+The database file is deleted and recreated.
+"""
+import argparse
+import time
+
+from common import fresh_database, random_event
+
+EVENTS = 1000
+SETTINGS_BURSTS = 20
+SETTINGS_PER_BURST = 10
+
+
+class CommitCounter:
+    """Count the COMMIT statements run on the writer connection"""
+
+    def __init__(self, db_manager):
+        """Install the counter as the writer's trace callback"""
+        self.commits = 0
+        with db_manager.pool.writing():
+            db_manager.conn.set_trace_callback(self._trace)
+
+    def _trace(self, statement):
+        """Called by sqlite3 with every statement the writer runs"""
+        if statement.strip().upper() == 'COMMIT':
+            self.commits += 1
+
+    def measure(self, name, work):
+        """Run work() and print its commits and duration"""
+        self.commits = 0
+        started = time.perf_counter()
+        work()
+        elapsed = time.perf_counter() - started
+        print(f"{name:<36}{self.commits:>8}{elapsed:>10.3f}")
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description="Compare the commits of grouped and ungrouped writes"
+    )
+    parser.add_argument("--db", default="commits.db", help="path of the scratch database")
+    args = parser.parse_args()
+
+    db_manager = fresh_database(args.db)
+    counter = CommitCounter(db_manager)
+    events = [random_event() for _ in range(EVENTS)]
+
+    def add_one_by_one():
+        for event_data in events:
+            db_manager.add_event(event_data)
+
+    def add_bulk():
+        db_manager.add_events_bulk(events)
+
+    def settings_one_by_one():
+        for burst in range(SETTINGS_BURSTS):
+            for key in range(SETTINGS_PER_BURST):
+                db_manager.update_setting(f'benchmark_{key}', str(burst))
+
+    def settings_grouped():
+        for burst in range(SETTINGS_BURSTS):
+            with db_manager.transaction():
+                for key in range(SETTINGS_PER_BURST):
+                    db_manager.update_setting(f'benchmark_{key}', str(burst))
+
+    print(f"{'work':<36}{'commits':>8}{'seconds':>10}")
+    counter.measure(f"{EVENTS} x add_event", add_one_by_one)
+    counter.measure(f"add_events_bulk of {EVENTS}", add_bulk)
+    counter.measure(f"{SETTINGS_BURSTS * SETTINGS_PER_BURST} x update_setting",
+                    settings_one_by_one)
+    counter.measure(f"{SETTINGS_BURSTS} transactions of {SETTINGS_PER_BURST} settings",
+                    settings_grouped)
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,49 @@
+"""Helpers shared by the benchmark scripts"""
+import os
+import random
+import sys
+from datetime import datetime, timedelta
+
+# The benchmarks import the app's modules from the repository root
+sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from database.db_manager import DatabaseManager
+
+TIME_FORMAT = '%Y-%m-%d %H:%M:%S'
+
+
+def random_event(year=2026, days=365, title='Benchmark event'):
+    """Build the data of a one-hour event somewhere in the given year"""
+    start = datetime(year, 1, 1) + timedelta(
+        days=random.randrange(days), hours=random.randrange(8, 20)
+    )
+    return {
+        'title': title,
+        'description': 'Generated by a benchmark',
+        'start_time': start.strftime(TIME_FORMAT),
+        'end_time': (start + timedelta(hours=1)).strftime(TIME_FORMAT),
+        'location': '',
+        'priority': random.choice(['low', 'medium', 'high']),
+        'color': '#4a6da7',
+        'is_recurring': False,
+        'recurrence_type': None,
+        'recurrence_end_date': None,
+    }
+
+
+def fresh_database(db_path):
+    """Delete db_path and its WAL files, and set up an empty calendar there"""
+    for suffix in ('', '-wal', '-shm', '-journal'):
+        if os.path.exists(db_path + suffix):
+            os.remove(db_path + suffix)
+
+    db_manager = DatabaseManager(db_path)
+    db_manager.setup_database()
+    return db_manager
+
+
+def month_window(year, month):
+    """Get the (start, end) strings of a calendar month"""
+    start = datetime(year, month, 1)
+    end = (start + timedelta(days=32)).replace(day=1) - timedelta(seconds=1)
+    return start.strftime(TIME_FORMAT), end.strftime(TIME_FORMAT)
@@ -0,0 +1,121 @@
+"""Stress the database with several processes writing and reading at once
+
+Starts a bulk importer, a process adding single events, a process claiming
+reminders (like the reminder daemon) and a few readers querying month
+ranges, all on the same database file. Each reports how many operations
+succeeded, how many failed and its latencies. With WAL mode and the busy
+retries, the error column should stay at zero.
+
+    python benchmarks/concurrency_stress.py --db /tmp/stress.db --duration 10
+
+The database file is deleted and recreated.
+"""
+import argparse
+import multiprocessing
+import random
+import statistics
+import time
+from collections import Counter
+
+from common import DatabaseManager, fresh_database, month_window, random_event
+
+# Events in the database before the processes start
+SEED_EVENTS = 3000
+
+# Events per add_events_bulk call of the bulk importer
+BULK_SIZE = 300
+
+
+def run_worker(name, db_path, duration, operation, results, pause=0):
+    """Call operation(db_manager, n) repeatedly for duration seconds
+
+    Puts (name, latencies of the successful calls, Counter of errors) on
+    the results queue.
+    """
+    db_manager = DatabaseManager(db_path)
+    latencies = []
+    errors = Counter()
+    deadline = time.monotonic() + duration
+    n = 0
+    while time.monotonic() < deadline:
+        n += 1
+        started = time.perf_counter()
+        try:
+            operation(db_manager, n)
+        except Exception as e:
+            errors[f"{type(e).__name__}: {e}"] += 1
+            db_manager.rollback()
+        else:
+            latencies.append(time.perf_counter() - started)
+        if pause:
+            time.sleep(pause)
+    db_manager.close()
+    results.put((name, latencies, errors))
+
+
+def bulk_import(db_manager, n):
+    db_manager.add_events_bulk([random_event() for _ in range(BULK_SIZE)])
+
+
+def add_single(db_manager, n):
+    db_manager.add_event(random_event())
+
+
+def claim(db_manager, n):
+    db_manager.claim_notification(n, '2026-01-01 00:00:00', 0)
+
+
+def read_month(db_manager, n):
+    db_manager.get_events_by_date_range(*month_window(2026, random.randint(1, 12)))
+    # Every query should reach the database, not the range cache
+    db_manager.range_cache.clear()
+
+
+def main():
+    """Stress test entry point"""
+    parser = argparse.ArgumentParser(
+        description="Run writers, readers and a reminder claimer on one database"
+    )
+    parser.add_argument("--db", default="stress.db", help="path of the scratch database")
+    parser.add_argument("--duration", type=float, default=10,
+                        help="seconds each process runs")
+    parser.add_argument("--readers", type=int, default=3, help="number of reader processes")
+    args = parser.parse_args()
+
+    db_manager = fresh_database(args.db)
+    db_manager.add_events_bulk([random_event() for _ in range(SEED_EVENTS)])
+    db_manager.close()
+
+    workers = [('bulk', bulk_import, 0), ('single', add_single, 0),
+               ('claimer', claim, 0.005)]
+    workers += [(f'reader{i + 1}', read_month, 0) for i in range(args.readers)]
+
+    results = multiprocessing.Queue()
+    processes = [
+        multiprocessing.Process(
+            target=run_worker,
+            args=(name, args.db, args.duration, operation, results, pause)
+        )
+        for name, operation, pause in workers
+    ]
+    for process in processes:
+        process.start()
+    reports = [results.get() for _ in processes]
+    for process in processes:
+        process.join()
+
+    print(f"{'process':<10}{'ok':>8}{'errors':>8}{'median ms':>12}{'worst ms':>12}")
+    all_errors = Counter()
+    for name, latencies, errors in sorted(reports):
+        median = statistics.median(latencies) * 1000 if latencies else 0
+        worst = max(latencies) * 1000 if latencies else 0
+        print(f"{name:<10}{len(latencies):>8}{sum(errors.values()):>8}"
+              f"{median:>12.1f}{worst:>12.1f}")
+        all_errors.update(errors)
+
+    for error, count in all_errors.most_common():
+        print(f"{count:>6} x {error}")
+
+
+if __name__ == "__main__":
+    main()
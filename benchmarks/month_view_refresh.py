@@ -0,0 +1,81 @@
+"""Time the month view's refresh when navigating between months
+
+Opens the calendar app on a scratch database with about 30 events a day,
+steps through the months with next_month and reports, for each month,
+MonthView.last_refresh_ms (the time spent rebuilding the grid) and the
+time until the month was fully shown, including the query on the
+database thread.
+
+It needs a display; on a headless machine run it under Xvfb:
+
+    xvfb-run -a python benchmarks/month_view_refresh.py --db /tmp/refresh.db
+
+The database file is deleted and recreated.
+"""
+import argparse
+import statistics
+import time
+import tkinter as tk
+
+from common import fresh_database, random_event
+
+from ui.app import CalendarApp
+
+EVENTS_PER_DAY = 30
+
+YEAR = 2026
+
+
+def wait_until_shown(root, month_view):
+    """Process Tk events until the month view has shown its events"""
+    while month_view.pending_load is not None or month_view.last_refresh_ms is None:
+        root.update()
+        time.sleep(0.001)
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description="Time month view refreshes while navigating between months"
+    )
+    parser.add_argument("--db", default="refresh.db", help="path of the scratch database")
+    parser.add_argument("--months", type=int, default=24, help="number of months to step through")
+    args = parser.parse_args()
+
+    db_manager = fresh_database(args.db)
+    db_manager.add_events_bulk(
+        random_event(year=YEAR) for _ in range(EVENTS_PER_DAY * 365)
+    )
+
+    root = tk.Tk()
+    root.geometry("1280x800")
+    app = CalendarApp(root, db_manager)
+    month_view = app.month_view
+    month_view.current_date = month_view.current_date.replace(year=YEAR, month=1, day=1)
+    month_view.refresh()
+    wait_until_shown(root, month_view)
+
+    refresh_times = []
+    shown_times = []
+    print(f"{'month':<10}{'refresh ms':>12}{'shown ms':>12}")
+    for _ in range(args.months):
+        month_view.last_refresh_ms = None
+        started = time.perf_counter()
+        month_view.next_month()
+        wait_until_shown(root, month_view)
+        shown_ms = (time.perf_counter() - started) * 1000
+
+        refresh_times.append(month_view.last_refresh_ms)
+        shown_times.append(shown_ms)
+        print(f"{month_view.current_date:%Y-%m}   "
+              f"{month_view.last_refresh_ms:>12.1f}{shown_ms:>12.1f}")
+
+    print(f"{'median':<10}{statistics.median(refresh_times):>12.1f}"
+          f"{statistics.median(shown_times):>12.1f}")
+
+    root.destroy()
+    db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
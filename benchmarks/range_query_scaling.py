@@ -0,0 +1,70 @@
+"""Measure how month range queries scale with the size of the events table
+
+Fills databases with 10k, 100k and 400k events at a constant density of
+about 27 events a day, so a bigger table covers more years, and times
+get_events_by_date_range over each month of the latest year. With the
+range index the time should stay roughly flat as the table grows, since
+a month matches about the same number of rows.
+
+    python benchmarks/range_query_scaling.py --dir /tmp
+
+The databases are created as range_<size>.db in --dir.
+"""
+import argparse
+import os
+import statistics
+import time
+
+from common import fresh_database, month_window, random_event
+
+# Events a year, i.e. the density every table size is generated at
+EVENTS_PER_YEAR = 10_000
+
+LAST_YEAR = 2026
+
+
+def build(db_path, size):
+    """Create a database holding size events, ending with LAST_YEAR"""
+    db_manager = fresh_database(db_path)
+    years = size // EVENTS_PER_YEAR
+    db_manager.add_events_bulk(
+        random_event(year=LAST_YEAR - i % years, days=365)
+        for i in range(size)
+    )
+    return db_manager
+
+
+def time_months(db_manager, repeat):
+    """Get the median time of a month range query, in milliseconds"""
+    timings = []
+    for _ in range(repeat):
+        for month in range(1, 13):
+            # Every query should reach the database, not the range cache
+            db_manager.range_cache.clear()
+            started = time.perf_counter()
+            db_manager.get_events_by_date_range(*month_window(LAST_YEAR, month))
+            timings.append((time.perf_counter() - started) * 1000)
+    return statistics.median(timings)
+
+
+def main():
+    """Benchmark entry point"""
+    parser = argparse.ArgumentParser(
+        description="Time month range queries on growing events tables"
+    )
+    parser.add_argument("--dir", default=".", help="directory for the scratch databases")
+    parser.add_argument("--sizes", type=int, nargs="+", default=[10_000, 100_000, 400_000],
+                        help="numbers of events to test (multiples of 10000)")
+    parser.add_argument("--repeat", type=int, default=3,
+                        help="times each month is queried")
+    args = parser.parse_args()
+
+    print(f"{'events':>10}{'median ms':>12}")
+    for size in args.sizes:
+        db_manager = build(os.path.join(args.dir, f"range_{size}.db"), size)
+        print(f"{size:>10}{time_months(db_manager, args.repeat):>12.1f}")
+        db_manager.close()
+
+
+if __name__ == "__main__":
+    main()
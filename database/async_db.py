@@ -0,0 +1,94 @@
+import queue
+import threading
+from concurrent.futures import Future
+
+
+class AsyncDatabase:
+    """Runs DatabaseManager calls on a dedicated database thread
+
+    The thread shares the app's DatabaseManager and reads through its own
+    pooled connection, so a slow query or a locked database file no longer
+    freezes the Tk main loop.
+    submit() returns a concurrent.futures.Future, and the callbacks given
+    to it run on the Tk thread through root.after. Calls run one at a time
+    in submission order, so reads see the writes submitted before them.
+    """
+
+    def __init__(self, root, db_manager):
+        """Initialize the facade and start the database thread"""
+        self.root = root
+        self.db_manager = db_manager
+
+        self._requests = queue.Queue()
+        self._change_listeners = []
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def submit(self, method, *args, callback=None, errback=None, **kwargs):
+        """Call a DatabaseManager method on the database thread
+
+        callback(result) or errback(exception) runs on the Tk thread when
+        the call finishes; neither runs if the future is cancelled first.
+        Without an errback, exceptions go to Tk's error reporting.
+        """
+        future = Future()
+        if callback is not None or errback is not None:
+            future.add_done_callback(
+                lambda f: self.root.after(0, self._deliver, f, callback, errback)
+            )
+        self._requests.put((future, method, args, kwargs))
+        return future
+
+    def add_change_listener(self, callback):
+        """Call callback() on the Tk thread after a submitted call changes events"""
+        self._change_listeners.append(callback)
+
+    def close(self):
+        """Stop the database thread once the submitted calls are done"""
+        self._requests.put(None)
+
+    def _run(self):
+        """Worker loop, executed on the database thread"""
+        db_manager = self.db_manager
+        # Registered from this thread, so it sees the changes made here
+        db_manager.add_change_listener(
+            lambda: self.root.after(0, self._notify_change)
+        )
+
+        while True:
+            request = self._requests.get()
+            if request is None:
+                break
+
+            future, method, args, kwargs = request
+            if not future.set_running_or_notify_cancel():
+                continue
+
+            try:
+                result = getattr(db_manager, method)(*args, **kwargs)
+            except Exception as e:
+                future.set_exception(e)
+            else:
+                future.set_result(result)
+
+        db_manager.close_thread_connection()
+
+    def _deliver(self, future, callback, errback):
+        """Pass the outcome of a call to its callbacks, on the Tk thread"""
+        if future.cancelled():
+            return
+
+        error = future.exception()
+        if error is None:
+            if callback is not None:
+                callback(future.result())
+        elif errback is not None:
+            errback(error)
+        else:
+            raise error
+
+    def _notify_change(self):
+        """Run the change listeners, on the Tk thread"""
+        for callback in self._change_listeners:
+            callback()
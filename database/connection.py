@@ -0,0 +1,193 @@
+import functools
+import random
+import sqlite3
+import threading
+import time
+from contextlib import contextmanager
+
+# How long SQLite itself waits for a lock before giving up (milliseconds)
+BUSY_TIMEOUT = 5000
+
+# Retries of a write that still failed with SQLITE_BUSY, e.g. a deadlock
+# between two transactions that SQLite's busy handler refuses to wait out
+BUSY_RETRIES = 5
+
+# Backoff before the first retry, doubled for each further one (seconds)
+BUSY_BACKOFF = 0.05
+
+# Pragmas applied to every connection. WAL lets readers and one writer work
+# at the same time; synchronous = NORMAL is durable across application
+# crashes in WAL mode and skips an fsync per commit.
+CONNECTION_PRAGMAS = (
+    ('busy_timeout', BUSY_TIMEOUT),
+    ('synchronous', 'NORMAL'),
+    ('temp_store', 'MEMORY'),
+    ('cache_size', -8000),  # 8 MB
+)
+
+
+def connect(db_path, check_same_thread=True):
+    """Open a connection to the calendar database
+
+    The database is switched to WAL mode, which is stored in the file, so
+    the app, an import and the reminder daemon can read while another
+    process writes instead of failing with "database is locked".
+    """
+    conn = sqlite3.connect(
+        db_path, timeout=BUSY_TIMEOUT / 1000, check_same_thread=check_same_thread
+    )
+    conn.row_factory = sqlite3.Row  # Return rows as dictionaries
+
+    # Switching the journal mode needs a moment without other writers
+    run_with_retry(lambda: conn.execute("PRAGMA journal_mode = WAL"))
+    for name, value in CONNECTION_PRAGMAS:
+        conn.execute(f"PRAGMA {name} = {value}")
+    return conn
+
+
+def is_busy_error(error):
+    """Check whether an exception is SQLite reporting a locked database"""
+    if not isinstance(error, sqlite3.OperationalError):
+        return False
+    # sqlite_errorcode is only set on Python 3.11 and later
+    error_code = getattr(error, 'sqlite_errorcode', None)
+    if error_code is None:
+        return str(error) == 'database is locked'
+    # Extended codes such as SQLITE_BUSY_SNAPSHOT keep the primary code in
+    # the low byte
+    return error_code & 0xff == 5  # SQLITE_BUSY
+
+
+def run_with_retry(operation, on_retry=None, retries=BUSY_RETRIES,
+                   backoff=BUSY_BACKOFF):
+    """Call operation(), retrying with exponential backoff while it is busy
+
+    on_retry() runs before each retry, to roll back the failed attempt.
+    Other errors, and the last busy error, are raised.
+    """
+    for attempt in range(retries + 1):
+        try:
+            return operation()
+        except sqlite3.OperationalError as e:
+            if attempt == retries or not is_busy_error(e):
+                raise
+        if on_retry is not None:
+            on_retry()
+        # Jitter keeps competing processes from retrying in lockstep
+        time.sleep(backoff * 2 ** attempt * random.uniform(0.5, 1.5))
+
+
+def write_method(method):
+    """Run a DatabaseManager write method in a transaction of its own
+
+    The method holds the pool's writer for its whole run, commits once at
+    the end and is retried while the database is busy. Called inside
+    DatabaseManager.transaction(), or from another write method, it joins
+    the enclosing transaction instead.
+    """
+    @functools.wraps(method)
+    def wrapper(self, *args, **kwargs):
+        if self.in_transaction():
+            return method(self, *args, **kwargs)
+
+        def attempt():
+            with self.transaction():
+                return method(self, *args, **kwargs)
+
+        return run_with_retry(attempt)
+
+    return wrapper
+
+
+class ConnectionPool:
+    """Per-thread read connections and one shared writer connection
+
+    Every thread reads through a connection of its own, opened on first
+    use, so with WAL its queries run in parallel with those of other
+    threads and with a write in progress. Writes from all threads go
+    through the single writer connection, one thread at a time; SQLite
+    allows only one writer anyway, and waiting on a Python lock is cheaper
+    than contending for the file lock.
+    """
+
+    def __init__(self, db_path):
+        """Open the writer connection; readers are opened lazily"""
+        self.db_path = db_path
+
+        self._writer = connect(db_path, check_same_thread=False)
+        self._writer_cursor = self._writer.cursor()
+        self._write_lock = threading.RLock()
+
+        # Holds the calling thread's (connection, cursor) and whether it is
+        # inside writing()
+        self._local = threading.local()
+
+        # Every open reader, so close() can reach those of other threads
+        self._readers = []
+        self._readers_lock = threading.Lock()
+
+    def connection(self):
+        """Get the connection the calling thread should use"""
+        return self._current()[0]
+
+    def cursor(self):
+        """Get the cursor of the connection the calling thread should use"""
+        return self._current()[1]
+
+    def is_writing(self):
+        """Check whether the calling thread is inside writing()"""
+        return getattr(self._local, 'writing', False)
+
+    @contextmanager
+    def writing(self, blocking=True):
+        """Route the calling thread's statements to the writer connection
+
+        Waits for other threads to finish writing. With blocking=False it
+        yields False right away instead if another thread is writing.
+        """
+        if not self._write_lock.acquire(blocking):
+            yield False
+            return
+
+        was_writing = self.is_writing()
+        self._local.writing = True
+        try:
+            yield True
+        finally:
+            self._local.writing = was_writing
+            self._write_lock.release()
+
+    def close_reader(self):
+        """Close the calling thread's read connection, if it has one"""
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            return
+
+        self._local.reader = None
+        with self._readers_lock:
+            if reader[0] in self._readers:
+                self._readers.remove(reader[0])
+        reader[0].close()
+
+    def close(self):
+        """Close the writer and every read connection"""
+        with self._readers_lock:
+            readers, self._readers = self._readers, []
+        for conn in readers:
+            conn.close()
+        self._writer.close()
+
+    def _current(self):
+        """Get the (connection, cursor) for the calling thread"""
+        if self.is_writing():
+            return self._writer, self._writer_cursor
+
+        reader = getattr(self._local, 'reader', None)
+        if reader is None:
+            # Readers may be closed by close() from another thread
+            conn = connect(self.db_path, check_same_thread=False)
+            reader = (conn, conn.cursor())
+            self._local.reader = reader
+            with self._readers_lock:
+                self._readers.append(conn)
+        return reader
@@ -1,19 +1,165 @@
 import sqlite3
 import os
+import re
+import threading
+from contextlib import contextmanager
 from datetime import datetime, timedelta
 
+from database.connection import ConnectionPool, write_method
+from database.migrations import migrate
+from database.models import Event
+from database.query_cache import RangeQueryCache
+from utils.recurrence import TIME_FORMAT, iter_occurrences, occurrence_id, to_epoch
+
+# How far ahead of today recurring series are materialized
+OCCURRENCE_HORIZON = timedelta(days=365)
+
+# Extra margin added when a query reaches past the materialized horizon
+OCCURRENCE_HORIZON_STEP = timedelta(days=90)
+
+
 class DatabaseManager:
     """Manages all database operations for the calendar application"""
     
+    # An event overlaps [start, end] when it starts before the window ends and
+    # ends after the window starts. The extra lower bound on the start (window
+    # start minus the longest event duration) turns the first condition into a
+    # bounded range scan on idx_events_range instead of a scan of every
+    # event that started before the window. Times are compared as integer
+    # epoch seconds (see utils.recurrence.to_epoch).
+    OVERLAP_PREDICATE = "(start_epoch BETWEEN ? AND ? AND end_epoch >= ?)"
+    
+    # Same overlap test for the materialized occurrences of recurring events,
+    # served by idx_occurrences_range
+    OCCURRENCE_OVERLAP_PREDICATE = """(occurrence_start_epoch BETWEEN ? AND ?
+        AND occurrence_end_epoch >= ?)"""
+    
+    # Event columns with the series times replaced by the occurrence times
+    OCCURRENCE_COLUMNS = """events.id, title, description,
+        occurrence_start AS start_time, occurrence_end AS end_time, location,
+        priority, color, is_recurring, recurrence_type, recurrence_end_date,
+        created_at, updated_at"""
+    
+    # Columns the calendar views need to draw an event
+    RENDER_COLUMNS = ('id', 'title', 'start_time', 'end_time', 'priority', 'color')
+    
+    # Recurring series that may have an occurrence inside [start, end]: the
+    # series began before the window ends and did not stop before it starts.
+    # Served by the partial index idx_events_recurring.
+    SERIES_PREDICATE = """(is_recurring = 1 AND start_epoch <= ?
+        AND (recurrence_end_date IS NULL OR recurrence_end_date >= ?))"""
+    
+    # Computes the fire time of every reminder of the matching single events
+    # and occurrences; {event_condition} and {occurrence_condition} filter
+    # the two sides of the union
+    SCHEDULE_REMINDERS_QUERY = """
+    INSERT OR IGNORE INTO scheduled_reminders
+        (fire_time, event_id, occurrence_start, offset_minutes, channel)
+    SELECT datetime(starts.occurrence_start,
+                    printf('%+d minutes', -reminders.offset_minutes)),
+           starts.event_id, starts.occurrence_start,
+           reminders.offset_minutes, reminders.channel
+    FROM (
+        SELECT id AS event_id, start_time AS occurrence_start FROM events
+        WHERE is_recurring = 0 AND {event_condition}
+        UNION ALL
+        SELECT event_id, occurrence_start FROM occurrences
+        WHERE {occurrence_condition}
+    ) AS starts
+    JOIN reminders ON reminders.event_id = starts.event_id
+    """
+    
+    INSERT_REMINDER_QUERY = """
+    INSERT OR IGNORE INTO reminders (event_id, offset_minutes, channel)
+    VALUES (?, ?, ?)
+    """
+    
+    # bm25 weights for the title, description and location columns
+    SEARCH_WEIGHTS = "10.0, 1.0, 3.0"
+    
+    INSERT_EVENT_QUERY = '''
+    INSERT INTO events (
+        title, description, start_time, end_time, location, 
+        priority, color, is_recurring, recurrence_type, recurrence_end_date,
+        start_epoch, end_epoch
+    ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
+    '''
+    
     def __init__(self, db_path="calendar.db"):
-        """Initialize the database connection"""
+        """Initialize the database connections
+        
+        The manager can be shared between threads: each thread reads
+        through its own connection, and the methods marked @write_method
+        take turns on a single writer connection.
+        """
         self.db_path = db_path
-        self.conn = sqlite3.connect(db_path)
-        self.conn.row_factory = sqlite3.Row  # Return rows as dictionaries
-        self.cursor = self.conn.cursor()
+        self.pool = ConnectionPool(db_path)
+        
+        # Longest event duration seen so far in seconds, used to bound range
+        # scans
+        self._max_event_span = None
+        
+        # Recurring series are materialized in the occurrences table up to
+        # this point in time
+        self._occurrence_horizon = None
+        
+        # Whether the events_fts full-text index exists (checked lazily)
+        self._fts_available = None
+        
+        # PRAGMA data_version of the writer connection as of the last
+        # check, to notice commits made through other connections (e.g.
+        # the reminder daemon)
+        self._data_version = None
+        
+        # Whether such a commit was seen since the last has_external_changes()
+        self._external_changes = False
+        
+        # (thread id, callback) run after events are added, updated or
+        # deleted on that thread
+        self._change_listeners = []
+        
+        # Results of date range queries, dropped by window when events change
+        self.range_cache = RangeQueryCache()
+        
+        # Whether transaction() is open, and the (callback, args) to run once
+        # it commits; only touched by the thread holding the writer
+        self._in_transaction = False
+        self._after_commit_callbacks = []
+    
+    @property
+    def conn(self):
+        """Connection of the calling thread, or the writer in a write method"""
+        return self.pool.connection()
+    
+    @property
+    def cursor(self):
+        """Cursor of the connection returned by conn"""
+        return self.pool.cursor()
     
     def setup_database(self):
-        """Create the necessary tables if they don't exist"""
+        """Create the tables if they don't exist and migrate the schema"""
+        # Another process, e.g. the reminder daemon, may be setting up the
+        # same database at the same time; the write lock taken up front makes
+        # the existence checks and one-time backfills atomic against it
+        with self.transaction(immediate=True):
+            self._create_tables()
+        migrate(self)
+        
+        # Databases created before the occurrences table existed need a
+        # full materialization once
+        if self.get_setting('occurrence_horizon') is None:
+            self.rebuild_occurrences()
+        
+        # Take the baseline for has_external_changes, so the first check
+        # already reports commits made by other processes since now
+        self._sync_with_other_connections()
+    
+    def _create_tables(self):
+        """Create the tables of the original schema if they don't exist
+        
+        Later schema changes, including the indexes used by range queries,
+        are migrations in database/migrations.py.
+        """
         # Events table
         self.cursor.execute('''
         CREATE TABLE IF NOT EXISTS events (
@@ -33,6 +179,20 @@ class DatabaseManager:
         )
         ''')
         
+        # Materialized occurrences of recurring events
+        self.cursor.execute('''
+        CREATE TABLE IF NOT EXISTS occurrences (
+            event_id INTEGER NOT NULL,
+            occurrence_start TIMESTAMP NOT NULL,
+            occurrence_end TIMESTAMP NOT NULL,
+            PRIMARY KEY (event_id, occurrence_start),
+            FOREIGN KEY (event_id) REFERENCES events (id)
+        ) WITHOUT ROWID
+        ''')
+        
+        # Full-text index over the searchable event fields
+        self.setup_search_index()
+        
         # Event history table for tracking changes
         self.cursor.execute('''
         CREATE TABLE IF NOT EXISTS event_history (
@@ -45,6 +205,52 @@ class DatabaseManager:
         )
         ''')
         
+        # Reminders attached to events, as minutes before the start. The
+        # notification ledger records one reminder per offset, so an event
+        # has at most one channel per offset
+        reminders_exist = self._table_exists('reminders')
+        self.cursor.execute('''
+        CREATE TABLE IF NOT EXISTS reminders (
+            id INTEGER PRIMARY KEY AUTOINCREMENT,
+            event_id INTEGER NOT NULL,
+            offset_minutes INTEGER NOT NULL,
+            channel TEXT NOT NULL DEFAULT 'notification',
+            UNIQUE (event_id, offset_minutes),
+            FOREIGN KEY (event_id) REFERENCES events (id)
+        )
+        ''')
+        
+        # Absolute fire times of the reminders of single events and of the
+        # materialized occurrences, so the next reminders are one index seek
+        self.cursor.execute('''
+        CREATE TABLE IF NOT EXISTS scheduled_reminders (
+            fire_time TIMESTAMP NOT NULL,
+            event_id INTEGER NOT NULL,
+            occurrence_start TIMESTAMP NOT NULL,
+            offset_minutes INTEGER NOT NULL,
+            channel TEXT NOT NULL,
+            PRIMARY KEY (fire_time, event_id, occurrence_start, offset_minutes,
+                         channel)
+        ) WITHOUT ROWID
+        ''')
+        
+        self.cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_scheduled_reminders_event
+        ON scheduled_reminders (event_id)
+        ''')
+        
+        # Reminders already shown, one row per occurrence and reminder
+        # offset; rows for past occurrences are expired
+        self.cursor.execute('''
+        CREATE TABLE IF NOT EXISTS notification_ledger (
+            event_id INTEGER NOT NULL,
+            occurrence_start TIMESTAMP NOT NULL,
+            reminder_offset INTEGER NOT NULL,
+            notified_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP,
+            PRIMARY KEY (event_id, occurrence_start, reminder_offset)
+        ) WITHOUT ROWID
+        ''')
+        
         # Settings table
         self.cursor.execute('''
         CREATE TABLE IF NOT EXISTS settings (
@@ -66,18 +272,211 @@ class DatabaseManager:
             INSERT OR IGNORE INTO settings (key, value) VALUES (?, ?)
             ''', (key, value))
         
-        self.conn.commit()
+        # Existing events get the global reminder that used to apply to them
+        if not reminders_exist:
+            self.cursor.execute("""
+            INSERT OR IGNORE INTO reminders (event_id, offset_minutes)
+            SELECT id, ? FROM events
+            """, (self._default_reminder_offset(),))
+            self._schedule_reminders()
+    
+    def _table_exists(self, name):
+        """Check whether a table exists"""
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = ?", (name,)
+        )
+        return self.cursor.fetchone() is not None
+    
+    def setup_search_index(self):
+        """Create the FTS5 search index and the triggers that keep it in sync
+        
+        The index is an external-content table over events, so the text is
+        not stored twice. If SQLite was built without FTS5, search falls back
+        to LIKE queries.
+        """
+        self.cursor.execute(
+            "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'"
+        )
+        if self.cursor.fetchone():
+            self._fts_available = True
+            return
+        
+        try:
+            self.cursor.execute('''
+            CREATE VIRTUAL TABLE events_fts USING fts5(
+                title, description, location,
+                content='events', content_rowid='id',
+                tokenize='unicode61 remove_diacritics 2',
+                prefix='2 3'
+            )
+            ''')
+        except sqlite3.OperationalError:
+            self._fts_available = False
+            return
+        
+        self.cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS events_fts_insert AFTER INSERT ON events BEGIN
+            INSERT INTO events_fts (rowid, title, description, location)
+            VALUES (new.id, new.title, new.description, new.location);
+        END
+        ''')
+        
+        self.cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS events_fts_delete AFTER DELETE ON events BEGIN
+            INSERT INTO events_fts (events_fts, rowid, title, description, location)
+            VALUES ('delete', old.id, old.title, old.description, old.location);
+        END
+        ''')
+        
+        self.cursor.execute('''
+        CREATE TRIGGER IF NOT EXISTS events_fts_update
+        AFTER UPDATE OF title, description, location ON events BEGIN
+            INSERT INTO events_fts (events_fts, rowid, title, description, location)
+            VALUES ('delete', old.id, old.title, old.description, old.location);
+            INSERT INTO events_fts (rowid, title, description, location)
+            VALUES (new.id, new.title, new.description, new.location);
+        END
+        ''')
+        
+        # Index the events that existed before the search index
+        self.cursor.execute("INSERT INTO events_fts (events_fts) VALUES ('rebuild')")
+        self._fts_available = True
     
+    def fts_available(self):
+        """Check whether the full-text search index can be used"""
+        if self._fts_available is None:
+            self.cursor.execute(
+                "SELECT 1 FROM sqlite_master WHERE type = 'table' AND name = 'events_fts'"
+            )
+            self._fts_available = self.cursor.fetchone() is not None
+        return self._fts_available
+    
+    @write_method
     def add_event(self, event_data):
         """Add a new event to the database"""
-        query = '''
-        INSERT INTO events (
-            title, description, start_time, end_time, location, 
-            priority, color, is_recurring, recurrence_type, recurrence_end_date
-        ) VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?)
-        '''
+        self.cursor.execute(self.INSERT_EVENT_QUERY, self._event_params(event_data))
+        
+        event_id = self.cursor.lastrowid
+        self._track_event_span(event_data)
+        self._materialize_occurrences(event_id, event_data)
+        self._set_reminders(event_id, self._event_reminders(event_data))
+        self._schedule_reminders(event_id)
+        
+        # Log the event creation in history
+        self.log_event_history(event_id, 'create', 'Event created')
+        
+        self._after_commit(self.range_cache.invalidate,
+                           *self._event_window(event_data))
+        self._after_commit(self._notify_change)
+        return event_id
+    
+    def add_events_bulk(self, events, batch_size=500):
+        """Add many events at once, committing once per batch
+        
+        Events and their history rows are written together, so an import of
+        N events costs N / batch_size commits instead of 2 * N. Returns the
+        ids of the new events in input order.
+        """
+        event_ids = []
+        batch = []
+        
+        for event_data in events:
+            batch.append(event_data)
+            if len(batch) >= batch_size:
+                event_ids.extend(self._insert_event_batch(batch))
+                batch = []
+        
+        if batch:
+            event_ids.extend(self._insert_event_batch(batch))
+        
+        if event_ids:
+            self._after_commit(self._notify_change)
+        return event_ids
+    
+    @write_method
+    def _insert_event_batch(self, batch):
+        """Insert a batch of events and their history in one transaction"""
+        event_ids = []
+        reminder_rows = []
+        default_offset = self._default_reminder_offset()
+        for event_data in batch:
+            self.cursor.execute(self.INSERT_EVENT_QUERY,
+                                self._event_params(event_data))
+            event_id = self.cursor.lastrowid
+            event_ids.append(event_id)
+            self._track_event_span(event_data)
+            self._materialize_occurrences(event_id, event_data)
+            reminder_rows.extend(
+                (event_id, int(reminder['offset_minutes']),
+                 reminder.get('channel', 'notification'))
+                for reminder in self._event_reminders(event_data, default_offset)
+            )
+        
+        # Reminders are stored and scheduled for the whole batch at once
+        self.cursor.executemany(self.INSERT_REMINDER_QUERY, reminder_rows)
+        if event_ids:
+            self._schedule_reminders(event_ids[0], event_ids[-1])
+        
+        self.cursor.executemany("""
+        INSERT INTO event_history (event_id, action, details)
+        VALUES (?, 'create', 'Event imported')
+        """, [(event_id,) for event_id in event_ids])
+        
+        # One invalidation spanning the whole batch
+        windows = [self._event_window(event_data) for event_data in batch]
+        self._after_commit(
+            self.range_cache.invalidate,
+            min(start for start, _ in windows), max(end for _, end in windows)
+        )
+        return event_ids
+    
+    def _event_window(self, event_data):
+        """Get the normalized time span an event's rows can appear in
         
-        self.cursor.execute(query, (
+        A recurring series spans from its first start to the end of its
+        last possible occurrence.
+        """
+        start = datetime.fromisoformat(event_data['start_time'])
+        end = datetime.fromisoformat(event_data['end_time'])
+        if event_data.get('is_recurring'):
+            if event_data.get('recurrence_end_date'):
+                end = (datetime.fromisoformat(event_data['recurrence_end_date'])
+                       + (end - start))
+            else:
+                end = datetime.max
+        return start.strftime(TIME_FORMAT), end.strftime(TIME_FORMAT)
+    
+    def _stored_event_window(self, event_id):
+        """Get the time span of an event as currently stored, if it exists"""
+        self.cursor.execute("""
+        SELECT start_time, end_time, is_recurring, recurrence_end_date
+        FROM events WHERE id = ?
+        """, (event_id,))
+        row = self.cursor.fetchone()
+        return self._event_window(dict(row)) if row else None
+    
+    def get_cache_stats(self):
+        """Get the hit, miss and invalidation counters of the range cache"""
+        return self.range_cache.stats()
+    
+    def add_change_listener(self, callback):
+        """Call callback() after every committed change to the events
+        
+        Only changes made on the thread that adds the listener are
+        reported, so callbacks registered on the Tk thread also run there.
+        """
+        self._change_listeners.append((threading.get_ident(), callback))
+    
+    def _notify_change(self):
+        """Run the change listeners of the calling thread"""
+        thread_id = threading.get_ident()
+        for listener_thread_id, callback in self._change_listeners:
+            if listener_thread_id == thread_id:
+                callback()
+    
+    def _event_params(self, event_data):
+        """Build the column values for INSERT_EVENT_QUERY"""
+        return (
             event_data['title'],
             event_data.get('description', ''),
             event_data['start_time'],
@@ -87,17 +486,12 @@ class DatabaseManager:
             event_data.get('color', '#3498db'),
             1 if event_data.get('is_recurring', False) else 0,
             event_data.get('recurrence_type', None),
-            event_data.get('recurrence_end_date', None)
-        ))
-        
-        event_id = self.cursor.lastrowid
-        
-        # Log the event creation in history
-        self.log_event_history(event_id, 'create', 'Event created')
-        
-        self.conn.commit()
-        return event_id
+            event_data.get('recurrence_end_date', None),
+            to_epoch(event_data['start_time']),
+            to_epoch(event_data['end_time'])
+        )
     
+    @write_method
     def update_event(self, event_id, event_data):
         """Update an existing event"""
         query = '''
@@ -112,38 +506,53 @@ class DatabaseManager:
             is_recurring = ?,
             recurrence_type = ?,
             recurrence_end_date = ?,
+            start_epoch = ?,
+            end_epoch = ?,
             updated_at = CURRENT_TIMESTAMP
         WHERE id = ?
         '''
         
-        self.cursor.execute(query, (
-            event_data['title'],
-            event_data.get('description', ''),
-            event_data['start_time'],
-            event_data['end_time'],
-            event_data.get('location', ''),
-            event_data.get('priority', 'medium'),
-            event_data.get('color', '#3498db'),
-            1 if event_data.get('is_recurring', False) else 0,
-            event_data.get('recurrence_type', None),
-            event_data.get('recurrence_end_date', None),
-            event_id
-        ))
+        old_window = self._stored_event_window(event_id)
+        self.cursor.execute(query, (*self._event_params(event_data), event_id))
+        self._track_event_span(event_data)
+        
+        # Recompute the occurrences of the event and their reminders
+        self.cursor.execute("DELETE FROM occurrences WHERE event_id = ?", (event_id,))
+        self._materialize_occurrences(event_id, event_data)
+        if 'reminders' in event_data:
+            self._set_reminders(event_id, event_data['reminders'])
+        self.cursor.execute(
+            "DELETE FROM scheduled_reminders WHERE event_id = ?", (event_id,)
+        )
+        self._schedule_reminders(event_id)
         
         # Log the event update in history
         self.log_event_history(event_id, 'update', 'Event updated')
         
-        self.conn.commit()
+        if old_window:
+            self._after_commit(self.range_cache.invalidate, *old_window)
+        self._after_commit(self.range_cache.invalidate,
+                           *self._event_window(event_data))
+        self._after_commit(self._notify_change)
         return True
     
+    @write_method
     def delete_event(self, event_id):
         """Delete an event from the database"""
+        old_window = self._stored_event_window(event_id)
         self.cursor.execute("DELETE FROM events WHERE id = ?", (event_id,))
+        self.cursor.execute("DELETE FROM occurrences WHERE event_id = ?", (event_id,))
+        self.cursor.execute("DELETE FROM reminders WHERE event_id = ?", (event_id,))
+        self.cursor.execute(
+            "DELETE FROM scheduled_reminders WHERE event_id = ?", (event_id,)
+        )
         
         # Log the event deletion in history
         self.log_event_history(event_id, 'delete', 'Event deleted')
         
-        self.conn.commit()
+        if old_window:
+            self._after_commit(self.range_cache.invalidate, *old_window)
+        self._after_commit(self._notify_change)
         return True
     
     def get_event(self, event_id):
@@ -151,71 +560,485 @@ class DatabaseManager:
         self.cursor.execute("SELECT * FROM events WHERE id = ?", (event_id,))
         return dict(self.cursor.fetchone())
     
-    def get_events_by_date_range(self, start_date, end_date):
-        """Get all events within a date range"""
-        query = """
-        SELECT * FROM events 
-        WHERE (start_time BETWEEN ? AND ?) 
-           OR (end_time BETWEEN ? AND ?)
-           OR (start_time <= ? AND end_time >= ?)
-        ORDER BY start_time
+    def get_events_by_date_range(self, start_date, end_date, expand_recurring=True):
+        """Get all events within a date range
+        
+        Recurring series are expanded into one entry per occurrence inside
+        the range, each with its own occurrence_id. Pass
+        expand_recurring=False to get the stored series rows instead.
+        """
+        return self._cached_range(
+            ('dicts', expand_recurring), start_date, end_date,
+            lambda: self._query_range("1", (), start_date, end_date, expand_recurring)
+        )
+    
+    def fetch_events(self, start_date, end_date, expand_recurring=True,
+                     columns=None):
+        """Get all events within a date range as Event objects
+        
+        Same rows as get_events_by_date_range, with start and end parsed
+        once here instead of by every view that draws them. columns limits
+        the columns read, e.g. to RENDER_COLUMNS, which single events read
+        from the idx_events_range covering index alone; the other Event
+        fields are None. id, start_time and end_time are always read.
         """
+        key = ('events', expand_recurring, columns)
+        if columns is not None:
+            columns = tuple(
+                column
+                if column in columns or column in ('id', 'start_time', 'end_time')
+                else f"NULL AS {column}"
+                for column in Event.COLUMNS
+            )
         
-        self.cursor.execute(query, (
-            start_date, end_date,
-            start_date, end_date,
-            start_date, end_date
-        ))
+        return self._cached_range(
+            key, start_date, end_date,
+            lambda: [
+                Event.from_row(row)
+                for row in self._query_range_rows(
+                    "1", (), start_date, end_date, expand_recurring, columns
+                )
+            ]
+        )
+    
+    def search_events(self, search_term, start_date=None, end_date=None, limit=None):
+        """Search events by title, description, or location
+        
+        Each word of the search term matches as a prefix. Without a date
+        range, results are ordered by relevance with title matches weighted
+        highest. With a date range, recurring events are expanded to their
+        occurrences and results are in chronological order, as the calendar
+        views show them.
+        """
+        if not self.fts_available():
+            return self._search_events_like(search_term, start_date, end_date)
         
+        match_query = self._fts_match_query(search_term)
+        if not match_query:
+            return []
+        
+        if start_date and end_date:
+            # The unary + keeps SQLite from driving the query through the
+            # list of matching ids, so the time index bounds the scan and the
+            # matches are only used as a lookup set
+            condition = (
+                "+events.id IN (SELECT rowid FROM events_fts WHERE events_fts MATCH ?)"
+            )
+            events = self._cached_range(
+                ('search', match_query), start_date, end_date,
+                lambda: self._query_range(
+                    condition, (match_query,), start_date, end_date
+                )
+            )
+            return events[:limit]
+        
+        query = f"""
+        SELECT events.* FROM events_fts
+        JOIN events ON events.id = events_fts.rowid
+        WHERE events_fts MATCH ?
+        ORDER BY bm25(events_fts, {self.SEARCH_WEIGHTS}), events.start_time
+        LIMIT ?
+        """
+        
+        self.cursor.execute(query, (match_query, -1 if limit is None else limit))
         return [dict(row) for row in self.cursor.fetchall()]
     
-    def search_events(self, search_term, start_date=None, end_date=None):
-        """Search events by title, description, or location"""
+    def _fts_match_query(self, search_term):
+        """Turn free text into an FTS5 query of quoted prefix terms"""
+        words = re.findall(r"\w+", search_term)
+        return " ".join(f'"{word}"*' for word in words)
+    
+    def _search_events_like(self, search_term, start_date=None, end_date=None):
+        """Search events with LIKE when full-text search is unavailable"""
         search_term = f"%{search_term}%"
+        condition = "(title LIKE ? OR description LIKE ? OR location LIKE ?)"
+        params = (search_term, search_term, search_term)
         
         if start_date and end_date:
-            query = """
-            SELECT * FROM events 
-            WHERE (title LIKE ? OR description LIKE ? OR location LIKE ?)
-            AND ((start_time BETWEEN ? AND ?) 
-               OR (end_time BETWEEN ? AND ?)
-               OR (start_time <= ? AND end_time >= ?))
-            ORDER BY start_time
-            """
-            
-            self.cursor.execute(query, (
-                search_term, search_term, search_term,
-                start_date, end_date,
-                start_date, end_date,
-                start_date, end_date
-            ))
-        else:
-            query = """
-            SELECT * FROM events 
-            WHERE title LIKE ? OR description LIKE ? OR location LIKE ?
+            return self._query_range(condition, params, start_date, end_date)
+        
+        query = f"""
+        SELECT * FROM events 
+        WHERE {condition}
+        ORDER BY start_time
+        """
+        
+        self.cursor.execute(query, params)
+        
+        return [dict(row) for row in self.cursor.fetchall()]
+    
+    def _cached_range(self, key, start_date, end_date, load):
+        """Serve a range query from the range cache, or load() and cache it
+        
+        The cached rows are shared between calls, so callers get a new
+        list but must not modify the events in it.
+        """
+        # Commits made through other connections clear the whole cache
+        self._sync_with_other_connections()
+        
+        start, end = self._normalize_window(start_date, end_date)
+        result = self.range_cache.get(key, start, end)
+        if result is None:
+            # Another thread may commit a change while this one loads
+            generation = self.range_cache.generation
+            result = load()
+            self.range_cache.put(key, start, end, result, generation)
+        return list(result)
+    
+    def _normalize_window(self, start_date, end_date):
+        """Get a date range in the stored timestamp format"""
+        return (datetime.fromisoformat(start_date).strftime(TIME_FORMAT),
+                datetime.fromisoformat(end_date).strftime(TIME_FORMAT))
+    
+    def _query_range(self, condition, params, start_date, end_date,
+                     expand_recurring=True):
+        """Get the events matching a condition that overlap a date range"""
+        rows = self._query_range_rows(
+            condition, params, start_date, end_date, expand_recurring
+        )
+        if not expand_recurring:
+            return [dict(row) for row in rows]
+        
+        events = []
+        for row in rows:
+            event = dict(row)
+            event['occurrence_id'] = occurrence_id(event['id'], event['start_time'])
+            events.append(event)
+        return events
+    
+    def _query_range_rows(self, condition, params, start_date, end_date,
+                          expand_recurring=True, columns=None):
+        """Get the rows of the events matching a condition in a date range
+        
+        Rows are ordered by start time and hold the given columns, or all of
+        them. With expand_recurring, recurring series are replaced by the
+        rows of their occurrences.
+        """
+        self._sync_with_other_connections()
+        overlap_params = self._overlap_params(start_date, end_date)
+        
+        event_columns = "*"
+        occurrence_columns = self.OCCURRENCE_COLUMNS
+        if columns is not None:
+            event_columns = ", ".join(columns)
+            occurrence_columns = ", ".join(
+                {
+                    'id': "events.id",
+                    'start_time': "occurrence_start AS start_time",
+                    'end_time': "occurrence_end AS end_time",
+                }.get(column, column)
+                for column in columns
+            )
+        
+        if not expand_recurring:
+            query = f"""
+            SELECT {event_columns} FROM events 
+            WHERE {condition} AND {self.OVERLAP_PREDICATE}
             ORDER BY start_time
             """
+            self.cursor.execute(query, (*params, *overlap_params))
+            return self.cursor.fetchall()
+        
+        # Single events
+        query = f"""
+        SELECT {event_columns} FROM events 
+        WHERE {condition} AND is_recurring = 0 AND {self.OVERLAP_PREDICATE}
+        """
+        self.cursor.execute(query, (*params, *overlap_params))
+        rows = self.cursor.fetchall()
+        
+        # Occurrences of recurring series
+        self._ensure_occurrence_horizon(end_date)
+        query = f"""
+        SELECT {occurrence_columns} FROM occurrences
+        JOIN events ON events.id = occurrences.event_id
+        WHERE {condition} AND {self.OCCURRENCE_OVERLAP_PREDICATE}
+        """
+        self.cursor.execute(query, (*params, *overlap_params))
+        rows.extend(self.cursor.fetchall())
+        
+        rows.sort(key=lambda row: row['start_time'])
+        return rows
+    
+    def _sync_with_other_connections(self):
+        """Drop cached values if another connection changed the database
+        
+        Returns True if another connection committed since the last check.
+        The check runs on the writer, whose data_version does not move for
+        the manager's own commits; while another thread is writing it is
+        skipped until the next call.
+        """
+        with self.pool.writing(blocking=False) as writer:
+            if not writer:
+                return False
             
-            self.cursor.execute(query, (search_term, search_term, search_term))
+            self.cursor.execute("PRAGMA data_version")
+            data_version = self.cursor.fetchone()[0]
+            changed = (self._data_version is not None
+                       and data_version != self._data_version)
+            if changed:
+                self._max_event_span = None
+                self._occurrence_horizon = None
+                self.range_cache.clear()
+                self._external_changes = True
+            self._data_version = data_version
+            return changed
+    
+    def has_external_changes(self):
+        """Check whether another connection or process changed the database
         
-        return [dict(row) for row in self.cursor.fetchall()]
+        Only reads PRAGMA data_version, so it is cheap enough to poll.
+        Commits noticed by range queries in the meantime are reported too.
+        """
+        self._sync_with_other_connections()
+        changed, self._external_changes = self._external_changes, False
+        return changed
+    
+    def _overlap_params(self, start_date, end_date):
+        """Build the parameters for OVERLAP_PREDICATE"""
+        start = to_epoch(start_date)
+        return (start - self._get_max_event_span(), to_epoch(end_date), start)
+    
+    def _get_max_event_span(self):
+        """Get the duration of the longest event in the database, in seconds"""
+        span = self._max_event_span
+        if span is None:
+            # Loaded on the writer, so a write committed on another thread
+            # meanwhile can't leave a stale span cached
+            with self.pool.writing():
+                self.cursor.execute(
+                    "SELECT MAX(end_epoch - start_epoch) AS span FROM events"
+                )
+                span = self.cursor.fetchone()['span'] or 0
+                self._max_event_span = span
+        return span
     
-    def get_upcoming_events(self, minutes=15):
-        """Get events that will start in the next X minutes"""
-        now = datetime.now()
-        notification_time = now + timedelta(minutes=minutes)
+    def _track_event_span(self, event_data):
+        """Widen the cached maximum event span for a newly written event"""
+        if self._max_event_span is None:
+            return
+        span = to_epoch(event_data['end_time']) - to_epoch(event_data['start_time'])
+        if span > self._max_event_span:
+            self._max_event_span = span
+    
+    def get_occurrence_horizon(self):
+        """Get the point in time up to which occurrences are materialized"""
+        horizon = self._occurrence_horizon
+        if horizon is None:
+            # Loaded on the writer, like the maximum event span
+            with self.pool.writing():
+                stored = self.get_setting('occurrence_horizon')
+                horizon = (
+                    datetime.fromisoformat(stored) if stored else datetime.now()
+                )
+                self._occurrence_horizon = horizon
+        return horizon
+    
+    @write_method
+    def rebuild_occurrences(self):
+        """Materialize the occurrences of every recurring event from scratch"""
+        horizon = datetime.now() + OCCURRENCE_HORIZON
+        self._occurrence_horizon = horizon
         
-        query = """
-        SELECT * FROM events 
-        WHERE start_time BETWEEN ? AND ?
-        ORDER BY start_time
+        self.cursor.execute("DELETE FROM occurrences")
+        self.cursor.execute("SELECT * FROM events WHERE is_recurring = 1")
+        for row in self.cursor.fetchall():
+            self._materialize_occurrences(row['id'], dict(row))
+        
+        self.cursor.execute("DELETE FROM scheduled_reminders")
+        self._schedule_reminders()
+        
+        self._store_occurrence_horizon(horizon)
+        self._after_commit(self.range_cache.clear)
+    
+    def roll_occurrence_horizon(self):
+        """Keep occurrences materialized a full horizon ahead of today
+        
+        Meant to be called periodically by a background job.
         """
+        self.extend_occurrence_horizon(datetime.now() + OCCURRENCE_HORIZON)
+    
+    @write_method
+    def extend_occurrence_horizon(self, until):
+        """Materialize the occurrences between the current horizon and until"""
+        horizon = self.get_occurrence_horizon()
+        if until <= horizon:
+            return
+        
+        self.cursor.execute(
+            f"SELECT * FROM events WHERE {self.SERIES_PREDICATE}",
+            (to_epoch(until), horizon.strftime(TIME_FORMAT))
+        )
+        for row in self.cursor.fetchall():
+            self._materialize_occurrences(row['id'], dict(row), horizon, until)
         
-        self.cursor.execute(query, (now.strftime('%Y-%m-%d %H:%M:%S'), 
-                                   notification_time.strftime('%Y-%m-%d %H:%M:%S')))
+        # Occurrences starting before the old horizon were already scheduled
+        self._schedule_reminders(since=horizon.strftime(TIME_FORMAT))
         
+        self._occurrence_horizon = until
+        self._store_occurrence_horizon(until)
+        self._after_commit(
+            self.range_cache.invalidate,
+            horizon.strftime(TIME_FORMAT), until.strftime(TIME_FORMAT)
+        )
+    
+    def _ensure_occurrence_horizon(self, end_date):
+        """Extend the materialized occurrences to cover a queried range"""
+        end = datetime.fromisoformat(end_date)
+        if end >= self.get_occurrence_horizon():
+            self.extend_occurrence_horizon(end + OCCURRENCE_HORIZON_STEP)
+    
+    def _store_occurrence_horizon(self, horizon):
+        """Persist the occurrence horizon without committing"""
+        self.cursor.execute(
+            "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
+            ('occurrence_horizon', horizon.strftime(TIME_FORMAT))
+        )
+    
+    def _materialize_occurrences(self, event_id, event_data, range_start=None,
+                                 range_end=None):
+        """Insert the occurrences of a recurring event starting in a range
+        
+        The range is [range_start, range_end) and defaults to everything from
+        the start of the series up to the current horizon. Single events are
+        left alone.
+        """
+        if not event_data.get('is_recurring'):
+            return
+        
+        start = datetime.fromisoformat(event_data['start_time'])
+        end = datetime.fromisoformat(event_data['end_time'])
+        recurrence_end = None
+        if event_data.get('recurrence_end_date'):
+            recurrence_end = datetime.fromisoformat(event_data['recurrence_end_date'])
+        
+        if range_start is None:
+            range_start = start
+        if range_end is None:
+            range_end = self.get_occurrence_horizon()
+        
+        # iter_occurrences selects by overlap; shifting the window by the
+        # event duration selects by start time instead. isoformat is used
+        # rather than strftime(TIME_FORMAT) because it is several times faster
+        # and gives the same text for whole-second times.
+        occurrences = iter_occurrences(
+            start, end, event_data['recurrence_type'], recurrence_end,
+            range_start + (end - start), range_end - timedelta(microseconds=1)
+        )
+        
+        self.cursor.executemany("""
+        INSERT OR IGNORE INTO occurrences (
+            event_id, occurrence_start, occurrence_end,
+            occurrence_start_epoch, occurrence_end_epoch
+        ) VALUES (?, ?, ?, ?, ?)
+        """, (
+            (event_id, occurrence_start.isoformat(' '), occurrence_end.isoformat(' '),
+             to_epoch(occurrence_start), to_epoch(occurrence_end))
+            for occurrence_start, occurrence_end in occurrences
+        ))
+    
+    def get_reminders(self, event_id):
+        """Get the reminders of an event, earliest first"""
+        self.cursor.execute("""
+        SELECT offset_minutes, channel FROM reminders
+        WHERE event_id = ?
+        ORDER BY offset_minutes DESC
+        """, (event_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
+    def get_upcoming_reminders(self, since, started_after, limit=100, until=None):
+        """Get the next reminders firing at or after since, in firing order
+        
+        A single seek on the scheduled_reminders primary key, up to but not
+        including until if it is given; limit None returns every match.
+        Reminders of occurrences that started before started_after, and
+        reminders already recorded in the notification ledger, are skipped.
+        Each row is an event dict with the occurrence start in start_time
+        plus fire_time, offset_minutes and channel.
+        """
+        if until is None:
+            until = '9999-12-31'
+        if limit is None:
+            limit = -1
+        
+        self.cursor.execute("""
+        SELECT events.id, title, description, location, priority, color,
+               s.occurrence_start AS start_time, s.fire_time,
+               s.offset_minutes, s.channel
+        FROM scheduled_reminders AS s
+        JOIN events ON events.id = s.event_id
+        WHERE s.fire_time >= ? AND s.fire_time < ? AND s.occurrence_start >= ?
+          AND NOT EXISTS (
+              SELECT 1 FROM notification_ledger AS l
+              WHERE l.event_id = s.event_id
+                AND l.occurrence_start = s.occurrence_start
+                AND l.reminder_offset = s.offset_minutes
+          )
+        ORDER BY s.fire_time
+        LIMIT ?
+        """, (since, until, started_after, limit))
+        
+        reminders = []
+        for row in self.cursor.fetchall():
+            reminder = dict(row)
+            reminder['occurrence_id'] = occurrence_id(
+                reminder['id'], reminder['start_time']
+            )
+            reminders.append(reminder)
+        return reminders
+    
+    def _default_reminder_offset(self):
+        """Get the reminder offset for events created without reminders"""
+        return int(self.get_setting('notification_time') or '15')
+    
+    def _event_reminders(self, event_data, default_offset=None):
+        """Get the reminders to store for new event data
+        
+        Event data without a 'reminders' list gets one reminder at the
+        notification_time setting.
+        """
+        if 'reminders' in event_data:
+            return event_data['reminders']
+        if default_offset is None:
+            default_offset = self._default_reminder_offset()
+        return [{'offset_minutes': default_offset, 'channel': 'notification'}]
+    
+    def _set_reminders(self, event_id, reminders):
+        """Replace the reminders of an event without committing"""
+        self.cursor.execute("DELETE FROM reminders WHERE event_id = ?", (event_id,))
+        self.cursor.executemany(self.INSERT_REMINDER_QUERY, [
+            (event_id, int(reminder['offset_minutes']),
+             reminder.get('channel', 'notification'))
+            for reminder in reminders
+        ])
+    
+    def _schedule_reminders(self, first_id=None, last_id=None, since=None):
+        """Fill scheduled_reminders without committing
+        
+        Covers the events with ids from first_id to last_id (just first_id
+        if last_id is not given), the occurrences starting at or after since
+        if that is given, and everything otherwise.
+        """
+        if first_id is not None:
+            if last_id is None:
+                last_id = first_id
+            query = self.SCHEDULE_REMINDERS_QUERY.format(
+                event_condition="id BETWEEN ? AND ?",
+                occurrence_condition="event_id BETWEEN ? AND ?"
+            )
+            self.cursor.execute(query, (first_id, last_id, first_id, last_id))
+        elif since is not None:
+            query = self.SCHEDULE_REMINDERS_QUERY.format(
+                event_condition="0", occurrence_condition="occurrence_start >= ?"
+            )
+            self.cursor.execute(query, (since,))
+        else:
+            query = self.SCHEDULE_REMINDERS_QUERY.format(
+                event_condition="1", occurrence_condition="1"
+            )
+            self.cursor.execute(query)
+    
+    @write_method
     def log_event_history(self, event_id, action, details):
         """Log an event history entry"""
         query = """
@@ -224,7 +1047,6 @@ class DatabaseManager:
         """
         
         self.cursor.execute(query, (event_id, action, details))
-        self.conn.commit()
     
     def get_event_history(self, event_id):
         """Get the history for a specific event"""
@@ -237,21 +1059,118 @@ class DatabaseManager:
         self.cursor.execute(query, (event_id,))
         return [dict(row) for row in self.cursor.fetchall()]
     
+    @write_method
+    def claim_notification(self, event_id, occurrence_start, reminder_offset):
+        """Record that a reminder is being shown
+        
+        Returns False if the reminder was already recorded, e.g. by an
+        earlier session, so every reminder is shown at most once.
+        """
+        self.cursor.execute("""
+        INSERT OR IGNORE INTO notification_ledger
+            (event_id, occurrence_start, reminder_offset)
+        VALUES (?, ?, ?)
+        """, (event_id, occurrence_start, reminder_offset))
+        return self.cursor.rowcount == 1
+    
+    @write_method
+    def claim_notifications(self, reminders):
+        """Record a group of reminders as shown, in one transaction
+        
+        reminders are dicts as returned by get_upcoming_reminders. Returns
+        the ones that were not recorded yet.
+        """
+        claimed = []
+        for reminder in reminders:
+            self.cursor.execute("""
+            INSERT OR IGNORE INTO notification_ledger
+                (event_id, occurrence_start, reminder_offset)
+            VALUES (?, ?, ?)
+            """, (reminder['id'], reminder['start_time'], reminder['offset_minutes']))
+            if self.cursor.rowcount == 1:
+                claimed.append(reminder)
+        return claimed
+    
+    @write_method
+    def expire_notifications(self, before):
+        """Forget the reminders of occurrences that started before a time"""
+        self.cursor.execute(
+            "DELETE FROM notification_ledger WHERE occurrence_start < ?", (before,)
+        )
+        # Reminders fire before their occurrence starts, so the fire_time
+        # bound keeps this a range seek on the primary key
+        self.cursor.execute("""
+        DELETE FROM scheduled_reminders
+        WHERE fire_time < ? AND occurrence_start < ?
+        """, (before, before))
+    
     def get_setting(self, key):
         """Get a setting value by key"""
         self.cursor.execute("SELECT value FROM settings WHERE key = ?", (key,))
         result = self.cursor.fetchone()
         return result['value'] if result else None
     
+    @write_method
     def update_setting(self, key, value):
         """Update a setting value"""
         self.cursor.execute(
             "INSERT OR REPLACE INTO settings (key, value) VALUES (?, ?)",
             (key, value)
         )
-        self.conn.commit()
+    
+    @contextmanager
+    def transaction(self, immediate=False):
+        """Run the writes made in the block as one transaction, committed once"""
+        with self.pool.writing():
+            # Holds the write lock from the first statement, DDL included
+            if immediate and not self.conn.in_transaction:
+                self.cursor.execute("BEGIN IMMEDIATE")
+            
+            if self._in_transaction:
+                yield
+                return
+            
+            self._in_transaction = True
+            try:
+                yield
+                self.conn.commit()
+            except BaseException:
+                self.rollback()
+                raise
+            finally:
+                self._in_transaction = False
+            callbacks, self._after_commit_callbacks = self._after_commit_callbacks, []
+        
+        # Caches are invalidated and listeners notified only once the
+        # changes are visible to the other connections
+        for callback, args in callbacks:
+            callback(*args)
+    
+    def in_transaction(self):
+        """Check whether the calling thread is inside transaction()"""
+        return self.pool.is_writing() and self._in_transaction
+    
+    def _after_commit(self, callback, *args):
+        """Run callback(*args) once the current transaction commits"""
+        if self.in_transaction():
+            self._after_commit_callbacks.append((callback, args))
+        else:
+            callback(*args)
+    
+    def rollback(self):
+        """Roll back the open transaction and the values cached from it"""
+        self.conn.rollback()
+        self._max_event_span = None
+        self._occurrence_horizon = None
+        self._after_commit_callbacks = []
+    
+    def close_thread_connection(self):
+        """Close the calling thread's read connection
+        
+        For worker threads that share the manager and are about to exit.
+        """
+        self.pool.close_reader()
     
     def close(self):
-        """Close the database connection"""
-        if self.conn:
-            self.conn.close()
\ No newline at end of file
+        """Close every database connection"""
+        self.pool.close()
\ No newline at end of file
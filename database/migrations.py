@@ -0,0 +1,182 @@
+from database.connection import run_with_retry
+
+# Rows updated per transaction when a migration backfills a new column,
+# so other processes can write in between
+BACKFILL_CHUNK = 5000
+
+
+def migrate(db_manager):
+    """Apply the migrations the database has not seen yet
+
+    setup_database creates the tables of the original schema; every later
+    change is an entry of MIGRATIONS. The versions applied are recorded in
+    the schema_version table, so each migration runs once per database.
+    """
+    with db_manager.transaction(immediate=True):
+        db_manager.cursor.execute('''
+        CREATE TABLE IF NOT EXISTS schema_version (
+            version INTEGER PRIMARY KEY,
+            description TEXT NOT NULL,
+            applied_at TIMESTAMP DEFAULT CURRENT_TIMESTAMP
+        )
+        ''')
+
+    for version, description, migration in MIGRATIONS:
+        if run_with_retry(lambda: _is_applied(db_manager, version)):
+            continue
+
+        # Every step of a migration commits on its own and can run again,
+        # since an interrupted run, or another process starting at the same
+        # time (e.g. the reminder daemon next to the app), repeats it
+        migration(db_manager)
+        run_with_retry(lambda: _record(db_manager, version, description))
+
+
+def _is_applied(db_manager, version):
+    """Check under the write lock whether a migration was recorded"""
+    with db_manager.transaction(immediate=True):
+        return get_schema_version(db_manager) >= version
+
+
+def _record(db_manager, version, description):
+    """Record a migration as applied, unless another process just did"""
+    with db_manager.transaction(immediate=True):
+        db_manager.cursor.execute(
+            "INSERT OR IGNORE INTO schema_version (version, description) VALUES (?, ?)",
+            (version, description)
+        )
+
+
+def get_schema_version(db_manager):
+    """Get the version of the latest migration applied, 0 for none"""
+    db_manager.cursor.execute("SELECT MAX(version) FROM schema_version")
+    return db_manager.cursor.fetchone()[0] or 0
+
+
+def _add_column(db_manager, table, column, definition):
+    """Add a column unless the table already has it
+
+    Must run in a transaction holding the write lock, so two processes
+    can't both find the column missing.
+    """
+    db_manager.cursor.execute(f"PRAGMA table_info({table})")
+    if column not in [row['name'] for row in db_manager.cursor.fetchall()]:
+        db_manager.cursor.execute(
+            f"ALTER TABLE {table} ADD COLUMN {column} {definition}"
+        )
+
+
+def _backfill(db_manager, table, key, pending, assignments):
+    """Run an UPDATE over the pending rows of a table, BACKFILL_CHUNK at a time
+
+    key is the tuple of primary key columns to walk the table by and
+    pending the condition of rows not filled in yet. Each chunk commits on
+    its own; an interrupted backfill skips the rows it already filled.
+    """
+    last = ()
+    while last is not None:
+        last = run_with_retry(lambda: _backfill_chunk(
+            db_manager, table, key, pending, assignments, last
+        ))
+
+
+def _backfill_chunk(db_manager, table, key, pending, assignments, after):
+    """Fill in the next BACKFILL_CHUNK pending rows with a key above after
+
+    Returns the key of the last row filled in, None when the table is done.
+    """
+    columns = ", ".join(key)
+    placeholders = ", ".join("?" * len(key))
+    condition = pending
+    params = ()
+    if after:
+        condition += f" AND ({columns}) > ({placeholders})"
+        params = after
+
+    with db_manager.transaction(immediate=True):
+        db_manager.cursor.execute(f"""
+        SELECT {columns} FROM {table} WHERE {condition}
+        ORDER BY {columns} LIMIT 1 OFFSET ?
+        """, (*params, BACKFILL_CHUNK - 1))
+        last = db_manager.cursor.fetchone()
+
+        if last is None:
+            # Fewer than BACKFILL_CHUNK rows left
+            db_manager.cursor.execute(
+                f"UPDATE {table} SET {assignments} WHERE {condition}", params
+            )
+            return None
+
+        db_manager.cursor.execute(f"""
+        UPDATE {table} SET {assignments}
+        WHERE {condition} AND ({columns}) <= ({placeholders})
+        """, (*params, *last))
+        return tuple(last)
+
+
+def add_epoch_columns(db_manager):
+    """Store event and occurrence times as integer epoch seconds as well
+
+    Range queries compare and index these integers instead of the
+    TIMESTAMP text. The text columns stay the source of truth for display
+    and export; see utils.recurrence.to_epoch for how times are counted.
+    """
+    def add_columns():
+        with db_manager.transaction(immediate=True):
+            _add_column(db_manager, 'events', 'start_epoch', 'INTEGER')
+            _add_column(db_manager, 'events', 'end_epoch', 'INTEGER')
+            _add_column(db_manager, 'occurrences', 'occurrence_start_epoch', 'INTEGER')
+            _add_column(db_manager, 'occurrences', 'occurrence_end_epoch', 'INTEGER')
+
+    run_with_retry(add_columns)
+
+    _backfill(db_manager, 'events', ('id',), 'start_epoch IS NULL', '''
+        start_epoch = CAST(strftime('%s', start_time) AS INTEGER),
+        end_epoch = CAST(strftime('%s', end_time) AS INTEGER)
+    ''')
+    _backfill(db_manager, 'occurrences', ('event_id', 'occurrence_start'),
+              'occurrence_start_epoch IS NULL', '''
+        occurrence_start_epoch = CAST(strftime('%s', occurrence_start) AS INTEGER),
+        occurrence_end_epoch = CAST(strftime('%s', occurrence_end) AS INTEGER)
+    ''')
+
+    run_with_retry(lambda: _replace_range_indexes(db_manager))
+
+
+def _replace_range_indexes(db_manager):
+    """Replace the indexes on the TIMESTAMP columns by ones on the epochs"""
+    with db_manager.transaction(immediate=True):
+        for index in ('idx_events_start_end', 'idx_events_range',
+                      'idx_events_recurring', 'idx_occurrences_start_end'):
+            db_manager.cursor.execute(f"DROP INDEX IF EXISTS {index}")
+
+        # Used by the overlap predicate in date range queries. The end and
+        # is_recurring columns let SQLite filter without touching the table
+        # rows, and the trailing RENDER_COLUMNS make it a covering index
+        # for the month and week views.
+        db_manager.cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_events_range
+        ON events (start_epoch, end_epoch, is_recurring, start_time, end_time,
+                   priority, color, title)
+        ''')
+
+        # Recurring series are materialized separately from single events
+        db_manager.cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_events_recurring
+        ON events (start_epoch) WHERE is_recurring = 1
+        ''')
+
+        # The primary key columns are part of every index of a WITHOUT
+        # ROWID table, so with occurrence_end this one covers the
+        # occurrence side of range queries
+        db_manager.cursor.execute('''
+        CREATE INDEX IF NOT EXISTS idx_occurrences_range
+        ON occurrences (occurrence_start_epoch, occurrence_end_epoch,
+                        occurrence_end)
+        ''')
+
+
+# (version, description, function taking the DatabaseManager), in order
+MIGRATIONS = [
+    (1, "Integer epoch start and end times", add_epoch_columns),
+]
@@ -0,0 +1,92 @@
+from datetime import datetime
+
+from utils.recurrence import TIME_FORMAT, occurrence_id
+
+
+class Event:
+    """An event, or one occurrence of a recurring series, as shown in a view
+
+    start and end are parsed once when the row is fetched, so the views do
+    not call datetime.fromisoformat on every redraw. __slots__ keeps each
+    instance much smaller than the dict a row used to be turned into.
+    """
+
+    # Event table columns read by from_row
+    COLUMNS = (
+        'id', 'title', 'description', 'start_time', 'end_time', 'location',
+        'priority', 'color', 'is_recurring', 'recurrence_type',
+        'recurrence_end_date',
+    )
+
+    __slots__ = (
+        'id', 'title', 'description', 'start', 'end', 'location', 'priority',
+        'color', 'is_recurring', 'recurrence_type', 'recurrence_end_date',
+        'occurrence_id',
+    )
+
+    def __init__(self, id, title, start, end, description=None, location=None,
+                 priority='medium', color=None, is_recurring=False,
+                 recurrence_type=None, recurrence_end_date=None,
+                 occurrence_id=None):
+        """Initialize an event; start and end are datetimes"""
+        self.id = id
+        self.title = title
+        self.description = description
+        self.start = start
+        self.end = end
+        self.location = location
+        self.priority = priority
+        self.color = color
+        self.is_recurring = is_recurring
+        self.recurrence_type = recurrence_type
+        self.recurrence_end_date = recurrence_end_date
+        self.occurrence_id = occurrence_id
+
+    @classmethod
+    def from_row(cls, row):
+        """Build an event from a row holding the COLUMNS"""
+        start_time = row['start_time']
+        return cls(
+            row['id'],
+            row['title'],
+            datetime.fromisoformat(start_time),
+            datetime.fromisoformat(row['end_time']),
+            row['description'],
+            row['location'],
+            row['priority'],
+            row['color'],
+            bool(row['is_recurring']),
+            row['recurrence_type'],
+            row['recurrence_end_date'],
+            occurrence_id(row['id'], start_time),
+        )
+
+    @property
+    def start_time(self):
+        """Start as stored in the database"""
+        return self.start.strftime(TIME_FORMAT)
+
+    @property
+    def end_time(self):
+        """End as stored in the database"""
+        return self.end.strftime(TIME_FORMAT)
+
+    def to_dict(self):
+        """Get the event as the dict DatabaseManager.add_event accepts"""
+        return {
+            'id': self.id,
+            'title': self.title,
+            'description': self.description,
+            'start_time': self.start_time,
+            'end_time': self.end_time,
+            'location': self.location,
+            'priority': self.priority,
+            'color': self.color,
+            'is_recurring': self.is_recurring,
+            'recurrence_type': self.recurrence_type,
+            'recurrence_end_date': self.recurrence_end_date,
+        }
+
+    def __repr__(self):
+        """Show the id, title and start of the event"""
+        return f"Event({self.id!r}, {self.title!r}, {self.start_time!r})"
@@ -0,0 +1,83 @@
+import threading
+from collections import OrderedDict
+
+
+class RangeQueryCache:
+    """LRU cache of date range query results
+
+    Entries are keyed on the query plus its normalized [start, end] window.
+    invalidate() drops only the entries whose window overlaps a changed
+    time span, so editing an event in March keeps a cached June intact.
+    The cache is safe to share between threads.
+    """
+
+    def __init__(self, max_entries=32):
+        """Initialize an empty cache"""
+        self.max_entries = max_entries
+
+        # (key, start, end) -> result
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+        # Bumped by every invalidation, so put() can refuse a result that
+        # was loaded before a change
+        self.generation = 0
+
+        self.hits = 0
+        self.misses = 0
+        self.invalidations = 0
+
+    def get(self, key, start, end):
+        """Get a cached result, or None on a miss"""
+        with self._lock:
+            result = self._entries.get((key, start, end))
+            if result is None:
+                self.misses += 1
+                return None
+
+            self._entries.move_to_end((key, start, end))
+            self.hits += 1
+            return result
+
+    def put(self, key, start, end, result, generation=None):
+        """Cache a result, evicting the least recently used ones
+
+        generation is the value of self.generation from before the result
+        was loaded; if an invalidation happened since, the result may be
+        stale and is not cached.
+        """
+        with self._lock:
+            if generation is not None and generation != self.generation:
+                return
+
+            self._entries[(key, start, end)] = result
+            while len(self._entries) > self.max_entries:
+                self._entries.popitem(last=False)
+
+    def invalidate(self, start, end):
+        """Drop the entries whose window overlaps [start, end]"""
+        with self._lock:
+            self.generation += 1
+            stale = [
+                entry for entry in self._entries
+                if entry[1] <= end and entry[2] >= start
+            ]
+            for entry in stale:
+                del self._entries[entry]
+            self.invalidations += len(stale)
+
+    def clear(self):
+        """Drop every entry"""
+        with self._lock:
+            self.generation += 1
+            self.invalidations += len(self._entries)
+            self._entries.clear()
+
+    def stats(self):
+        """Get the hit, miss and invalidation counters and the entry count"""
+        return {
+            'hits': self.hits,
+            'misses': self.misses,
+            'invalidations': self.invalidations,
+            'entries': len(self._entries),
+        }
@@ -0,0 +1,107 @@
+import argparse
+import heapq
+import itertools
+import os
+import sys
+import threading
+import time
+from datetime import datetime
+
+# Add the current directory to the path so we can import our modules
+sys.path.append(os.path.dirname(os.path.abspath(__file__)))
+
+from database.db_manager import DatabaseManager
+from utils.notifications import NotificationManager
+
+# How often to extend the materialized occurrences of recurring events
+# (seconds); their reminders are only scheduled once they are materialized
+OCCURRENCE_ROLL_INTERVAL = 6 * 60 * 60
+
+class ReminderLoop:
+    """Timer loop with the after/after_cancel interface of a Tk root
+
+    Lets NotificationManager schedule reminders without Tk. after() may be
+    called from any thread; callbacks run on the thread that calls run().
+    """
+
+    def __init__(self):
+        """Initialize an empty loop"""
+        self._timers = []  # Heap of (due time, timer id, callback, args)
+        self._cancelled = set()
+        self._ids = itertools.count(1)
+        self._condition = threading.Condition()
+
+    def after(self, ms, callback, *args):
+        """Run callback(*args) after ms milliseconds"""
+        with self._condition:
+            timer_id = next(self._ids)
+            heapq.heappush(
+                self._timers, (time.monotonic() + ms / 1000, timer_id, callback, args)
+            )
+            self._condition.notify()
+            return timer_id
+
+    def after_cancel(self, timer_id):
+        """Cancel a timer created by after()"""
+        with self._condition:
+            self._cancelled.add(timer_id)
+
+    def run(self):
+        """Run timers as they come due, forever"""
+        while True:
+            with self._condition:
+                while True:
+                    if not self._timers:
+                        self._condition.wait()
+                        continue
+
+                    due, timer_id, callback, args = self._timers[0]
+                    if timer_id in self._cancelled:
+                        heapq.heappop(self._timers)
+                        self._cancelled.discard(timer_id)
+                        continue
+
+                    delay = due - time.monotonic()
+                    if delay <= 0:
+                        heapq.heappop(self._timers)
+                        break
+                    self._condition.wait(delay)
+
+            callback(*args)
+
+def print_reminder(title, message):
+    """Fallback delivery when no system notification backend is available"""
+    print(f"[{datetime.now():%Y-%m-%d %H:%M}] {title} - {message}", flush=True)
+
+def main():
+    """Reminder daemon entry point"""
+    parser = argparse.ArgumentParser(
+        description="Show event reminders without opening the calendar window"
+    )
+    parser.add_argument("--db", default="calendar.db", help="path to the calendar database")
+    args = parser.parse_args()
+
+    db_manager = DatabaseManager(args.db)
+    db_manager.setup_database()
+
+    loop = ReminderLoop()
+    notification_manager = NotificationManager(db_manager, loop, fallback=print_reminder)
+    notification_manager.start()
+
+    # Without the calendar app running, nothing else keeps the recurring
+    # events materialized past the horizon
+    def maintain_occurrences():
+        db_manager.roll_occurrence_horizon()
+        loop.after(OCCURRENCE_ROLL_INTERVAL * 1000, maintain_occurrences)
+
+    maintain_occurrences()
+
+    try:
+        loop.run()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        db_manager.close()
+
+if __name__ == "__main__":
+    main()
@@ -7,6 +7,7 @@ import calendar
 import gettext
 
 # Import our modules
+from database.async_db import AsyncDatabase
 from ui.calendar_view import MonthView, WeekView
 from ui.event_form import EventForm
 from ui.theme_manager import ThemeManager
@@ -14,6 +15,8 @@ from utils.notifications import NotificationManager
 from utils.import_export import ImportExportManager
 from utils.i18n import I18nManager
 from utils.shortcuts import ShortcutManager
+from utils.live_search import LiveSearch
+from utils.prefetch import Prefetcher
 
 
 class CalendarApp:
@@ -32,7 +35,14 @@ class CalendarApp:
         self.theme_manager = ThemeManager(self.root, self.db_manager)
 
         # Set up notification manager
-        self.notification_manager = NotificationManager(self.db_manager)
+        self.notification_manager = NotificationManager(self.db_manager, self.root)
+
+        # Database thread for the calendar views and the event form, so
+        # slow queries don't block the window
+        self.async_db = AsyncDatabase(self.root, self.db_manager)
+
+        # Changes made on the database thread also move the reminders
+        self.async_db.add_change_listener(self.notification_manager.reschedule)
 
         # Set up import/export manager
         self.import_export_manager = ImportExportManager(self.db_manager)
@@ -40,11 +50,29 @@ class CalendarApp:
         # Set up shortcut manager
         self.shortcut_manager = ShortcutManager(self)
 
+        # Set up search-as-you-type for the toolbar search box
+        self.live_search = LiveSearch(
+            self.root, self.db_manager, self.show_live_results
+        )
+        self.search_dropdown = None
+        self.search_dropdown_ids = []
+
+        # Load the neighbouring months or weeks in the background
+        self.prefetcher = Prefetcher(self.async_db, self.db_manager.RENDER_COLUMNS)
+
         # Initialize UI components
         self.setup_ui()
 
-        # Start notification checker
-        self.check_notifications()
+        # Redraw the calendar views when the theme changes
+        self.theme_manager.add_theme_listener(self.on_theme_changed)
+
+        # Start the reminder schedule
+        self.notification_manager.start()
+
+        # Start the job that keeps recurring events materialized ahead
+        self.maintain_occurrences()
+
+        self.prefetch_adjacent_periods()
 
     def setup_ui(self):
         """Set up the main UI components"""
@@ -78,49 +106,28 @@ class CalendarApp:
         status_frame.grid(row=3, column=0, sticky="ew")
 
         # Create a canvas for the gradient background
-        status_canvas = tk.Canvas(
-            status_frame,
-            height=36,
-            bg=self.theme_manager.themes[self.theme_manager.current_theme]["header"],
-            highlightthickness=0,
-        )
+        status_canvas = tk.Canvas(status_frame, height=36, highlightthickness=0)
         status_canvas.pack(fill=tk.X, expand=True)
+        self.theme_manager.style_widget(status_canvas, bg="header")
 
-        # Create gradient
-        theme = self.theme_manager.themes[self.theme_manager.current_theme]
-        status_canvas.update_idletasks()
-        width = status_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 1000
-
-        # Create gradient from left to right
-        for i in range(width):
-            # Calculate color based on position
-            r1, g1, b1 = status_canvas.winfo_rgb(theme["header"])
-            r2, g2, b2 = status_canvas.winfo_rgb(theme["accent"])
-
-            # Adjust the gradient to be subtle
-            ratio = i / width * 0.2  # Only go 20% toward the accent color
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            status_canvas.create_line(i, 0, i, 36, fill=color)
+        # Create gradient from left to right, only 20% toward the accent color
+        self.theme_manager.gradients.attach(
+            status_canvas, "header", "accent", vertical=False, strength=0.2
+        )
 
         # Status text
         self.status_var = tk.StringVar()
         self.status_var.set(self._("Ready"))
 
-        status_canvas.create_text(
+        status_text = status_canvas.create_text(
             20,
             18,
             text=self.status_var.get(),
-            fill=theme["fg"],
             font=("SF Pro Display", 11),
             anchor="w",
             tags="status_text",
         )
+        self.theme_manager.style_canvas_item(status_canvas, status_text, fill="fg")
 
         # Update status text when variable changes
         def update_status(*args):
@@ -202,40 +209,26 @@ class CalendarApp:
 
     def create_toolbar(self):
         """Create the application toolbar"""
-        theme = self.theme_manager.themes[self.theme_manager.current_theme]
-
         # Create a frame for the toolbar with a gradient background
-        toolbar_frame = tk.Frame(self.root, bg=theme["bg"])
+        toolbar_frame = tk.Frame(self.root)
         toolbar_frame.grid(row=1, column=0, sticky="ew", padx=0, pady=0)
+        self.theme_manager.style_widget(toolbar_frame, bg="bg")
 
         # Create a canvas for the gradient background
-        toolbar_canvas = tk.Canvas(
-            toolbar_frame, height=70, bg=theme["bg"], highlightthickness=0
-        )
+        toolbar_canvas = tk.Canvas(toolbar_frame, height=70, highlightthickness=0)
         toolbar_canvas.pack(fill=tk.X, expand=True)
+        self.theme_manager.style_widget(toolbar_canvas, bg="bg")
+
+        # Create gradient from top to bottom
+        self.theme_manager.gradients.attach(toolbar_canvas, "header", "bg")
 
-        # Create gradient
-        toolbar_canvas.update_idletasks()
         width = toolbar_canvas.winfo_width()
         if width < 10:  # If not yet rendered, use a default
             width = 1000
 
-        # Create gradient from top to bottom
-        for i in range(70):
-            # Calculate color based on position
-            r1, g1, b1 = toolbar_canvas.winfo_rgb(theme["header"])
-            r2, g2, b2 = toolbar_canvas.winfo_rgb(theme["bg"])
-
-            ratio = i / 70
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            toolbar_canvas.create_line(0, i, width, i, fill=color)
-
         # Left side controls
-        left_frame = tk.Frame(toolbar_canvas, bg=theme["header"])
+        left_frame = tk.Frame(toolbar_canvas)
+        self.theme_manager.style_widget(left_frame, bg="header")
         toolbar_canvas.create_window(15, 35, window=left_frame, anchor="w")
 
         # Add event button
@@ -257,9 +250,10 @@ class CalendarApp:
         self.today_btn.pack(side=tk.LEFT, padx=(0, 20))
 
         # Center frame for period label
-        center_frame = tk.Frame(toolbar_canvas, bg=theme["header"])
+        center_frame = tk.Frame(toolbar_canvas)
+        self.theme_manager.style_widget(center_frame, bg="header")
         toolbar_canvas.create_window(
-            width / 2, 35, window=center_frame, anchor="center"
+            width / 2, 35, window=center_frame, anchor="center", tags="center"
         )
 
         # Navigation buttons and period label
@@ -271,11 +265,9 @@ class CalendarApp:
         # Current period label
         self.period_var = tk.StringVar()
         self.period_label = ttk.Label(
-            center_frame,
-            textvariable=self.period_var,
-            style="Title.TLabel",
-            background=theme["header"],
+            center_frame, textvariable=self.period_var, style="Title.TLabel"
         )
+        self.theme_manager.style_widget(self.period_label, background="header")
         self.period_label.pack(side=tk.LEFT, padx=20)
 
         self.next_btn = ttk.Button(
@@ -284,14 +276,23 @@ class CalendarApp:
         self.next_btn.pack(side=tk.LEFT)
 
         # Right side controls
-        right_frame = tk.Frame(toolbar_canvas, bg=theme["header"])
-        toolbar_canvas.create_window(width - 15, 35, window=right_frame, anchor="e")
+        right_frame = tk.Frame(toolbar_canvas)
+        self.theme_manager.style_widget(right_frame, bg="header")
+        toolbar_canvas.create_window(
+            width - 15, 35, window=right_frame, anchor="e", tags="right"
+        )
+
+        # Keep the center and right controls in place when the window resizes
+        def on_toolbar_resize(e):
+            toolbar_canvas.coords("center", e.width / 2, 35)
+            toolbar_canvas.coords("right", e.width - 15, 35)
+
+        toolbar_canvas.bind("<Configure>", on_toolbar_resize, add="+")
 
         # Search entry with rounded corners
-        search_container = tk.Frame(
-            right_frame, background=theme["header"], highlightthickness=0
-        )
+        search_container = tk.Frame(right_frame, highlightthickness=0)
         search_container.pack(side=tk.RIGHT, padx=(10, 0))
+        self.theme_manager.style_widget(search_container, background="header")
 
         # Create a canvas for the rounded search box
         search_height = 36
@@ -300,10 +301,10 @@ class CalendarApp:
             search_container,
             width=search_width,
             height=search_height,
-            bg=theme["header"],
             highlightthickness=0,
         )
         search_canvas.pack()
+        self.theme_manager.style_widget(search_canvas, bg="header")
 
         # Function to create rounded rectangle
         def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=10, **kwargs):
@@ -336,7 +337,6 @@ class CalendarApp:
             return canvas.create_polygon(points, smooth=True, **kwargs)
 
         # Draw the rounded rectangle
-        search_bg_color = theme["card"]
         search_rect = create_rounded_rectangle(
             search_canvas,
             0,
@@ -344,20 +344,20 @@ class CalendarApp:
             search_width,
             search_height,
             radius=18,
-            fill=search_bg_color,
             outline="",
         )
+        self.theme_manager.style_canvas_item(search_canvas, search_rect, fill="card")
 
         # Add search icon
         search_icon_text = "🔍"
-        search_canvas.create_text(
+        search_icon = search_canvas.create_text(
             18,
             search_height / 2,
             text=search_icon_text,
-            fill=theme["accent"],
             font=("SF Pro Display", 12),
             anchor="w",
         )
+        self.theme_manager.style_canvas_item(search_canvas, search_icon, fill="accent")
 
         # Add search entry
         self.search_var = tk.StringVar()
@@ -367,9 +367,8 @@ class CalendarApp:
             font=("SF Pro Display", 11),
             bd=0,
             highlightthickness=0,
-            bg=search_bg_color,
-            fg=theme["fg"],
         )
+        self.theme_manager.style_widget(search_entry, bg="card")
         search_canvas.create_window(
             36,
             search_height / 2,
@@ -378,25 +377,37 @@ class CalendarApp:
             width=search_width - 50,
         )
 
-        # Add placeholder text
+        # Add placeholder text, shown in the border color
+        def update_entry_color():
+            theme = self.theme_manager.themes[self.theme_manager.current_theme]
+            is_placeholder = search_entry.get() == self._("Search events...")
+            search_entry.config(fg=theme["border"] if is_placeholder else theme["fg"])
+
         def on_entry_click(event):
             if search_entry.get() == self._("Search events..."):
                 search_entry.delete(0, tk.END)
-                search_entry.config(fg=theme["fg"])
+                update_entry_color()
 
         def on_focus_out(event):
             if search_entry.get() == "":
                 search_entry.insert(0, self._("Search events..."))
-                search_entry.config(fg=theme["border"])
+                update_entry_color()
 
         search_entry.insert(0, self._("Search events..."))
-        search_entry.config(fg=theme["border"])
+        update_entry_color()
         search_entry.bind("<FocusIn>", on_entry_click)
         search_entry.bind("<FocusOut>", on_focus_out)
+        self.theme_manager.add_theme_listener(update_entry_color)
 
         # Bind search entry to search function
         search_entry.bind("<Return>", lambda e: self.search_events())
 
+        # Search as the user types, with results in a dropdown
+        self.search_entry = search_entry
+        self.search_var.trace_add("write", lambda *args: self.on_search_changed())
+        search_entry.bind("<Escape>", lambda e: self.hide_search_dropdown())
+        search_entry.bind("<Down>", lambda e: self.focus_search_dropdown())
+
     def register_shortcuts(self):
         """Register keyboard shortcuts"""
         self.root.bind("<Control-n>", lambda e: self.create_event())
@@ -408,8 +419,11 @@ class CalendarApp:
         EventForm(self.root, self.db_manager, self, callback=self.refresh_views)
 
     def edit_event(self, event_id):
-        """Open the event editing form"""
-        event_data = self.db_manager.get_event(event_id)
+        """Open the event editing form once the full event is loaded"""
+        self.async_db.submit("get_event", event_id, callback=self.open_event_form)
+
+    def open_event_form(self, event_data):
+        """Open the event editing form for a loaded event"""
         if event_data:
             EventForm(
                 self.root,
@@ -429,12 +443,20 @@ class CalendarApp:
                     event_data["title"]
                 ),
             ):
-                self.db_manager.delete_event(event_id)
-                self.refresh_views()
-                self.status_var.set(self._("Event deleted"))
+                self.async_db.submit(
+                    "delete_event", event_id, callback=self.on_event_deleted
+                )
+
+    def on_event_deleted(self, result):
+        """Refresh the views after an event was deleted"""
+        self.refresh_views()
+        self.status_var.set(self._("Event deleted"))
 
     def search_events(self):
         """Search for events based on the search term"""
+        self.live_search.cancel()
+        self.hide_search_dropdown()
+
         search_term = self.search_var.get()
         if search_term == self._("Search events..."):
             search_term = ""
@@ -461,6 +483,94 @@ class CalendarApp:
                 self._("No events found matching '{}'").format(search_term),
             )
 
+    def on_search_changed(self):
+        """Start a live search when the search entry text changes"""
+        search_term = self.search_var.get().strip()
+        if not search_term or search_term == self._("Search events..."):
+            self.live_search.cancel()
+            self.hide_search_dropdown()
+            return
+
+        self.live_search.schedule(search_term)
+
+    def show_live_results(self, events, first, done):
+        """Show a chunk of live search results in the dropdown"""
+        if first:
+            self.show_search_dropdown()
+            self.search_listbox.delete(0, tk.END)
+            self.search_dropdown_ids = []
+
+            if not events:
+                self.search_listbox.insert(tk.END, self._("No events found"))
+                return
+
+        for event in events:
+            start_time = datetime.fromisoformat(event["start_time"])
+            self.search_listbox.insert(
+                tk.END, f"{start_time.strftime('%b %d, %Y %H:%M')}  {event['title']}"
+            )
+            self.search_dropdown_ids.append(event["id"])
+
+    def show_search_dropdown(self):
+        """Show the live search dropdown below the search entry"""
+        if self.search_dropdown is None:
+            self.search_dropdown = tk.Toplevel(self.root)
+            self.search_dropdown.overrideredirect(True)  # No window decorations
+            self.search_dropdown.withdraw()
+
+            self.search_listbox = tk.Listbox(
+                self.search_dropdown,
+                height=8,
+                font=("SF Pro Display", 11),
+                selectforeground="#ffffff",
+                highlightthickness=1,
+                activestyle="none",
+                bd=0,
+            )
+            self.search_listbox.pack(fill=tk.BOTH, expand=True)
+            self.theme_manager.style_widget(
+                self.search_listbox,
+                bg="card",
+                fg="fg",
+                selectbackground="accent",
+                highlightbackground="border",
+            )
+
+            self.search_listbox.bind(
+                "<ButtonRelease-1>", lambda e: self.open_search_selection()
+            )
+            self.search_listbox.bind("<Return>", lambda e: self.open_search_selection())
+            self.search_listbox.bind("<Escape>", lambda e: self.hide_search_dropdown())
+
+        # Place the dropdown right under the search entry
+        x = self.search_entry.winfo_rootx() - 30
+        y = self.search_entry.winfo_rooty() + self.search_entry.winfo_height() + 12
+        self.search_dropdown.geometry(f"320x180+{x}+{y}")
+        self.search_dropdown.deiconify()
+        self.search_dropdown.lift()
+
+    def hide_search_dropdown(self):
+        """Hide the live search dropdown"""
+        if self.search_dropdown is not None:
+            self.search_dropdown.withdraw()
+
+    def focus_search_dropdown(self):
+        """Move keyboard focus from the search entry into the dropdown"""
+        if self.search_dropdown is not None and self.search_dropdown_ids:
+            self.search_listbox.focus_set()
+            self.search_listbox.selection_clear(0, tk.END)
+            self.search_listbox.selection_set(0)
+            self.search_listbox.activate(0)
+
+    def open_search_selection(self):
+        """Open the event selected in the live search dropdown"""
+        selection = self.search_listbox.curselection()
+        if not selection or selection[0] >= len(self.search_dropdown_ids):
+            return
+
+        self.hide_search_dropdown()
+        self.edit_event(self.search_dropdown_ids[selection[0]])
+
     def show_search_results(self, events):
         """Display search results in a new window"""
         theme = self.theme_manager.themes[self.theme_manager.current_theme]
@@ -483,25 +593,8 @@ class CalendarApp:
         )
         header_canvas.pack(fill=tk.X)
 
-        # Create gradient
-        header_canvas.update_idletasks()
-        width = header_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 600
-
         # Create gradient from top to bottom
-        for i in range(60):
-            # Calculate color based on position
-            r1, g1, b1 = header_canvas.winfo_rgb(theme["header"])
-            r2, g2, b2 = header_canvas.winfo_rgb(theme["bg"])
-
-            ratio = i / 60
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            header_canvas.create_line(0, i, width, i, fill=color)
+        self.theme_manager.gradients.attach(header_canvas, "header", "bg")
 
         # Add title
         header_canvas.create_text(
@@ -661,12 +754,15 @@ class CalendarApp:
             ),
         )
 
+        # Recurring events are exported as series, not as single occurrences
         if not export_all:
-            events = self.db_manager.get_events_by_date_range(start_date, end_date)
+            events = self.db_manager.fetch_events(
+                start_date, end_date, expand_recurring=False
+            )
         else:
             # Get all events (using a very wide date range)
-            events = self.db_manager.get_events_by_date_range(
-                "1900-01-01 00:00:00", "2100-12-31 23:59:59"
+            events = self.db_manager.fetch_events(
+                "1900-01-01 00:00:00", "2100-12-31 23:59:59", expand_recurring=False
             )
 
         if not events:
@@ -717,6 +813,7 @@ class CalendarApp:
             self.week_view.go_to_today()
 
         self.update_period_label()
+        self.prefetch_adjacent_periods()
 
     def previous_period(self):
         """Navigate to the previous period (month/week)"""
@@ -726,6 +823,7 @@ class CalendarApp:
             self.week_view.previous_week()
 
         self.update_period_label()
+        self.prefetch_adjacent_periods()
 
     def next_period(self):
         """Navigate to the next period (month/week)"""
@@ -735,6 +833,16 @@ class CalendarApp:
             self.week_view.next_week()
 
         self.update_period_label()
+        self.prefetch_adjacent_periods()
+
+    def prefetch_adjacent_periods(self):
+        """Load the periods before and after the current one in the background"""
+        if self.notebook.index("current") == 0:  # Month view
+            view = self.month_view
+        else:  # Week view
+            view = self.week_view
+
+        self.prefetcher.prefetch([view.get_date_range(-1), view.get_date_range(1)])
 
     def update_period_label(self):
         """Update the period label based on the current view"""
@@ -751,6 +859,7 @@ class CalendarApp:
         """Handle tab change event"""
         self.update_period_label()
         self.refresh_current_view()
+        self.prefetch_adjacent_periods()
 
     def refresh_views(self):
         """Refresh all calendar views"""
@@ -765,13 +874,17 @@ class CalendarApp:
             self.week_view.refresh()
 
     def change_theme(self, theme_name):
-        """Change the application theme"""
+        """Change the application theme
+
+        Existing widgets are restyled in place by the theme manager; only the
+        calendar views need to redraw the colors they paint themselves.
+        """
         self.theme_manager.set_theme(theme_name)
-        self.db_manager.update_setting("theme", theme_name)
 
-        # Refresh the UI to apply the new theme
-        self.setup_ui()
-        self.refresh_views()
+    def on_theme_changed(self):
+        """Redraw the colors the calendar views paint themselves"""
+        self.month_view.refresh()
+        self.week_view.draw_grid()
 
     def change_language(self, lang_code):
         """Change the application language"""
@@ -786,15 +899,15 @@ class CalendarApp:
             ),
         )
 
-    def check_notifications(self):
-        """Check for upcoming events and show notifications"""
-        notification_time = int(
-            self.db_manager.get_setting("notification_time") or "15"
-        )
-        self.notification_manager.check_and_notify(notification_time)
+    def maintain_occurrences(self):
+        """Extend the materialized occurrences of recurring events"""
+        # After a long time without the app, this materializes months of
+        # occurrences, so it runs on the database thread. Views reaching
+        # past the horizon extend it themselves in the meantime.
+        self.async_db.submit("roll_occurrence_horizon")
 
-        # Schedule the next check in 1 minute
-        self.root.after(60000, self.check_notifications)
+        # Roll the horizon forward again in 6 hours
+        self.root.after(6 * 60 * 60 * 1000, self.maintain_occurrences)
 
     def show_about(self):
         """Show the about dialog"""
@@ -815,31 +928,10 @@ class CalendarApp:
         about_canvas.pack(fill=tk.BOTH, expand=True)
 
         # Create a radial gradient background
-        center_x, center_y = 225, 150
-        radius = 300
-
-        # Draw concentric circles with decreasing opacity
-        for r in range(radius, 0, -5):
-            # Calculate color based on radius
-            r1, g1, b1 = about_canvas.winfo_rgb(theme["accent"])
-            r2, g2, b2 = about_canvas.winfo_rgb(theme["bg"])
-
-            ratio = r / radius
-            r_color = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g_color = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b_color = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r_color:02x}{g_color:02x}{b_color:02x}"
-
-            about_canvas.create_oval(
-                center_x - r,
-                center_y - r,
-                center_x + r,
-                center_y + r,
-                outline=color,
-                width=5,
-                fill="",
-            )
+        about_canvas.gradient = self.theme_manager.gradients.radial(
+            theme["accent"], theme["bg"], 450, 500, (225, 150), 300
+        )
+        about_canvas.create_image(0, 0, image=about_canvas.gradient, anchor="nw")
 
         # App icon (using emoji as placeholder)
         about_canvas.create_text(
@@ -1,13 +1,18 @@
 import tkinter as tk
 from tkinter import ttk
+import tkinter.font as tkfont
 import calendar
 from datetime import datetime, timedelta
 import locale
+import time
 
 
 class BaseCalendarView(ttk.Frame):
     """Base class for calendar views"""
 
+    # Milliseconds a query may take before the loading placeholder shows
+    PLACEHOLDER_DELAY = 150
+
     def __init__(self, parent, db_manager, app):
         super().__init__(parent)
         self.db_manager = db_manager
@@ -17,6 +22,12 @@ class BaseCalendarView(ttk.Frame):
         # Set the current date to today
         self.current_date = datetime.now()
 
+        # Latest event query, see load_events
+        self.load_generation = 0
+        self.pending_load = None
+        self.placeholder = None
+        self.placeholder_timer = None
+
         # Initialize the UI
         self.setup_ui()
 
@@ -32,8 +43,9 @@ class BaseCalendarView(ttk.Frame):
         """Get the current date being displayed"""
         return self.current_date
 
-    def get_date_range(self):
-        """Get the date range being displayed - to be implemented by subclasses"""
+    def get_date_range(self, offset=0):
+        """Get the date range being displayed, or the one offset periods away
+        - to be implemented by subclasses"""
         pass
 
     def go_to_today(self):
@@ -41,12 +53,85 @@ class BaseCalendarView(ttk.Frame):
         self.current_date = datetime.now()
         self.refresh()
 
+    def load_events(self, start_date, end_date, on_loaded):
+        """Fetch the rendering columns of a range on the database thread
+
+        on_loaded(events) runs on the Tk thread unless a newer load was
+        started in the meantime. A "Loading..." placeholder covers the view
+        if the query takes longer than PLACEHOLDER_DELAY.
+        """
+        self.load_generation += 1
+        generation = self.load_generation
+
+        if self.pending_load is not None:
+            self.pending_load.cancel()
+        if self.placeholder_timer is None:
+            self.placeholder_timer = self.after(
+                self.PLACEHOLDER_DELAY, self.show_placeholder
+            )
+
+        def loaded(events):
+            if generation == self.load_generation:
+                self.pending_load = None
+                self.hide_placeholder()
+                on_loaded(events)
+
+        def failed(error):
+            if generation == self.load_generation:
+                self.pending_load = None
+                # Keep the pending "Loading..." from replacing the error
+                self.hide_placeholder()
+                self.show_placeholder(self._("Could not load events"))
+
+        self.pending_load = self.app.async_db.submit(
+            "fetch_events",
+            start_date,
+            end_date,
+            columns=self.db_manager.RENDER_COLUMNS,
+            callback=loaded,
+            errback=failed,
+        )
+
+    def show_placeholder(self, text=None):
+        """Cover the view with a loading message"""
+        self.placeholder_timer = None
+        if self.placeholder is None:
+            self.placeholder = ttk.Label(self, style="Subtitle.TLabel")
+        self.placeholder.configure(text=text or self._("Loading..."))
+        self.placeholder.place(relx=0.5, rely=0.5, anchor="center")
+        self.placeholder.lift()
+
+    def hide_placeholder(self):
+        """Remove the loading message, or stop it from showing"""
+        if self.placeholder_timer is not None:
+            self.after_cancel(self.placeholder_timer)
+            self.placeholder_timer = None
+        if self.placeholder is not None:
+            self.placeholder.place_forget()
+
 
 class MonthView(BaseCalendarView):
     """Monthly calendar view"""
 
+    # Events shown per day cell before the "more" indicator
+    MAX_EVENTS = 3
+
+    # Height of an event chip in pixels
+    CHIP_HEIGHT = 22
+
     def setup_ui(self):
         """Set up the monthly view UI"""
+        # Pool of 42 day cells (6 weeks), created on the first refresh
+        self.day_cells = []
+        self.last_refresh_ms = None
+
+        # Time spent clearing the cells for a new month, counted into the
+        # last_refresh_ms of the load that follows
+        self.pending_refresh_ms = 0
+
+        # (year, month) the cells currently show
+        self.shown_month = None
+
         self.columnconfigure(0, weight=1)
         self.rowconfigure(0, weight=0)  # Header
         self.rowconfigure(1, weight=1)  # Calendar grid
@@ -82,10 +167,54 @@ class MonthView(BaseCalendarView):
         self.refresh()
 
     def refresh(self):
-        """Refresh the month view"""
-        # Clear the calendar frame
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        """Refresh the month view
+
+        The events are loaded on the database thread. When the month
+        changes, the cells show the new days without events until they
+        arrive.
+        """
+        month = (self.current_date.year, self.current_date.month)
+        if month != self.shown_month:
+            started = time.perf_counter()
+            self.fill_cells({})
+            self.shown_month = month
+            self.pending_refresh_ms += (time.perf_counter() - started) * 1000
+
+        self.load_events(*self.get_date_range(), self.show_events)
+
+    def show_events(self, events):
+        """Show the loaded events of the displayed month"""
+        started = time.perf_counter()
+        first_day = datetime(self.current_date.year, self.current_date.month, 1)
+
+        # Create a dictionary to store events by day; events that started in
+        # the previous month are shown on the first day
+        events_by_day = {}
+        for event in events:
+            event_date = event.start.day if event.start >= first_day else 1
+            if event_date not in events_by_day:
+                events_by_day[event_date] = []
+            events_by_day[event_date].append(event)
+
+        self.fill_cells(events_by_day)
+
+        # Time spent rebuilding the grid, for profiling
+        self.last_refresh_ms = (
+            self.pending_refresh_ms + (time.perf_counter() - started) * 1000
+        )
+        self.pending_refresh_ms = 0
+
+    def fill_cells(self, events_by_day):
+        """Fill the pooled day cells for the displayed month
+
+        The day cells and event chips are created once by build_grid and
+        only reconfigured here, so navigating between months does not
+        allocate any Tk widgets.
+        """
+        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+
+        if not self.day_cells:
+            self.build_grid()
 
         # Get the month calendar
         year = self.current_date.year
@@ -97,235 +226,249 @@ class MonthView(BaseCalendarView):
 
         # Adjust for Monday as the first day of the week (0 = Monday in our grid)
         first_weekday = first_day.weekday()
+        num_weeks = (first_weekday + num_days + 6) // 7
 
-        # Get events for this month
-        start_date = first_day.strftime("%Y-%m-%d 00:00:00")
-        end_date = datetime(year, month, num_days, 23, 59, 59).strftime(
-            "%Y-%m-%d 23:59:59"
+        today = datetime.now()
+        today_day = (
+            today.day if (today.year, today.month) == (year, month) else None
         )
-        events = self.db_manager.get_events_by_date_range(start_date, end_date)
 
-        # Create a dictionary to store events by day
-        events_by_day = {}
-        for event in events:
-            event_date = datetime.fromisoformat(event["start_time"]).day
-            if event_date not in events_by_day:
-                events_by_day[event_date] = []
-            events_by_day[event_date].append(event)
-
-        # Create the calendar grid
-        day = 1
+        # Fill the pooled cells
         for week in range(6):  # Maximum of 6 weeks in a month view
-            if day > num_days:
-                break
+            # Hide the rows this month does not need
+            self.calendar_frame.rowconfigure(week, weight=1 if week < num_weeks else 0)
 
             for weekday in range(7):  # 7 days in a week
-                if week == 0 and weekday < first_weekday:
-                    # Empty cell before the first day of the month
-                    cell = ttk.Frame(self.calendar_frame, style="Cell.TFrame")
-                    cell.grid(row=week, column=weekday, sticky="nsew", padx=2, pady=2)
-                    self.calendar_frame.columnconfigure(weekday, weight=1)
-                    self.calendar_frame.rowconfigure(week, weight=1)
-                elif day <= num_days:
-                    # Create a day cell
-                    cell = self.create_day_cell(
-                        week, weekday, day, events_by_day.get(day, [])
+                cell = self.day_cells[week * 7 + weekday]
+                day = week * 7 + weekday - first_weekday + 1
+
+                if week >= num_weeks:
+                    cell["frame"].grid_remove()
+                    continue
+
+                cell["frame"].grid()
+                if 1 <= day <= num_days:
+                    self.update_day_cell(
+                        cell, day, events_by_day.get(day, []), day == today_day, theme
                     )
-                    day += 1
                 else:
-                    # Empty cell after the last day of the month
-                    cell = ttk.Frame(self.calendar_frame, style="Cell.TFrame")
-                    cell.grid(row=week, column=weekday, sticky="nsew", padx=2, pady=2)
+                    # Empty cell before the first or after the last day
+                    self.update_day_cell(cell, None, [], False, theme)
 
-    def create_day_cell(self, week, weekday, day, events):
-        """Create a cell for a specific day with its events"""
-        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+    def build_grid(self):
+        """Create the pool of day cells reused by every refresh"""
+        for weekday in range(7):
+            self.calendar_frame.columnconfigure(weekday, weight=1, uniform="day")
 
-        # Check if this is today
-        is_today = (
-            self.current_date.year == datetime.now().year
-            and self.current_date.month == datetime.now().month
-            and day == datetime.now().day
-        )
+        for week in range(6):
+            for weekday in range(7):
+                self.day_cells.append(self.create_day_cell(week, weekday))
+
+    def create_day_cell(self, week, weekday):
+        """Create an empty day cell with its event chips"""
+        cell = {"day": None, "is_today": False}
 
-        # Create the cell frame with appropriate style
-        cell_style = "TodayCell.TFrame" if is_today else "Cell.TFrame"
-        cell = ttk.Frame(self.calendar_frame, style=cell_style)
-        cell.grid(row=week, column=weekday, sticky="nsew", padx=2, pady=2)
+        # Create the cell frame
+        frame = ttk.Frame(self.calendar_frame, style="Cell.TFrame")
+        frame.grid(row=week, column=weekday, sticky="nsew", padx=2, pady=2)
 
         # Configure the cell to be responsive
-        cell.columnconfigure(0, weight=1)
+        frame.columnconfigure(0, weight=1)
+        cell["frame"] = frame
 
         # Create a header frame for the day number
-        day_header = ttk.Frame(cell, style="TFrame")
+        day_header = ttk.Frame(frame, style="TFrame")
         day_header.grid(row=0, column=0, sticky="new", padx=2, pady=2)
+        cell["header"] = day_header
 
-        # Day number label with special styling for today
-        day_label_style = "Today.TLabel" if is_today else "TLabel"
+        # Day number label, swapped for a circular badge on today
+        cell["day_label"] = ttk.Label(day_header, style="TLabel")
+        cell["day_label"].pack(side=tk.LEFT, padx=6, pady=2)
 
-        # Create a circular background for the day number if it's today
-        if is_today:
-            # Create a canvas for the circular background
-            day_canvas = tk.Canvas(
-                day_header, width=28, height=28, bg=theme["card"], highlightthickness=0
-            )
-            day_canvas.pack(side=tk.LEFT, padx=4, pady=2)
+        day_canvas = tk.Canvas(day_header, width=28, height=28, highlightthickness=0)
+        cell["day_canvas"] = day_canvas
+        cell["day_circle"] = day_canvas.create_oval(2, 2, 26, 26, outline="")
+        cell["day_text"] = day_canvas.create_text(
+            14, 14, fill="white", font=("SF Pro Display", 11, "bold")
+        )
 
-            # Draw the circle
-            day_canvas.create_oval(2, 2, 26, 26, fill=theme["accent"], outline="")
+        # Events in the cell
+        event_frame = ttk.Frame(frame, style="TFrame")
+        event_frame.grid(row=1, column=0, sticky="nsew", padx=2, pady=2)
+        event_frame.columnconfigure(0, weight=1)
+        cell["event_frame"] = event_frame
 
-            # Add the day number
-            day_canvas.create_text(
-                14, 14, text=str(day), fill="white", font=("SF Pro Display", 11, "bold")
-            )
-        else:
-            day_label = ttk.Label(day_header, text=str(day), style=day_label_style)
-            day_label.pack(side=tk.LEFT, padx=6, pady=2)
+        cell["chips"] = [
+            self.create_event_chip(event_frame, i) for i in range(self.MAX_EVENTS)
+        ]
 
-        # Add events to the cell
-        event_frame = ttk.Frame(cell, style="TFrame")
-        event_frame.grid(row=1, column=0, sticky="nsew", padx=2, pady=2)
+        # "More" indicator, shown when a day has more events than chips
+        more_label = ttk.Label(event_frame, style="TLabel", font=("SF Pro Display", 8))
+        more_label.grid(row=self.MAX_EVENTS, column=0, sticky="w", padx=5, pady=1)
+        more_label.grid_remove()
+        cell["more_label"] = more_label
 
-        # Sort events by start time
-        events.sort(key=lambda e: e["start_time"])
+        # Bind click to show all events for this day
+        more_label.bind("<Button-1>", lambda e: self.show_day_events(cell["day"]))
 
-        # Display up to 3 events, with a "more" indicator if there are more
-        max_events = 3
-        for i, event in enumerate(events[:max_events]):
-            event_time = datetime.fromisoformat(event["start_time"]).strftime("%H:%M")
+        # Make the entire cell clickable to add a new event
+        def on_double_click(e):
+            if cell["day"] is not None:
+                self.add_event_on_day(cell["day"])
 
-            # Get color based on priority or use a color from the palette
-            event_color = event.get(
-                "color",
-                self.app.theme_manager.get_event_color(i, event.get("priority")),
-            )
+        frame.bind("<Double-1>", on_double_click)
 
-            # Create a container for the event
-            event_container = tk.Frame(
-                event_frame,
-                background=theme["card"],
-                borderwidth=0,
-                highlightthickness=0,
-            )
-            event_container.grid(row=i, column=0, sticky="ew", pady=1)
-            event_frame.columnconfigure(0, weight=1)
-
-            # Create the event with rounded corners using a Canvas
-            event_height = 22
-            event_canvas = tk.Canvas(
-                event_container,
-                height=event_height,
-                bg=theme["card"],
-                highlightthickness=0,
-            )
-            event_canvas.pack(fill=tk.X, expand=True)
-
-            # Calculate width based on parent
-            event_container.update_idletasks()
-            event_width = event_container.winfo_width()
-            if event_width < 2:  # If not yet rendered, use a default
-                event_width = 100
-
-            event_canvas.config(width=event_width)
-
-            # Function to create rounded rectangle
-            def create_rounded_rectangle(canvas, x1, y1, x2, y2, radius=10, **kwargs):
-                points = [
-                    x1 + radius,
-                    y1,
-                    x2 - radius,
-                    y1,
-                    x2,
-                    y1,
-                    x2,
-                    y1 + radius,
-                    x2,
-                    y2 - radius,
-                    x2,
-                    y2,
-                    x2 - radius,
-                    y2,
-                    x1 + radius,
-                    y2,
-                    x1,
-                    y2,
-                    x1,
-                    y2 - radius,
-                    x1,
-                    y1 + radius,
-                    x1,
-                    y1,
-                ]
-                return canvas.create_polygon(points, smooth=True, **kwargs)
+        return cell
 
-            # Draw the rounded rectangle
-            event_rect = create_rounded_rectangle(
-                event_canvas,
-                2,
-                0,
-                event_width - 2,
-                event_height,
-                radius=6,
-                fill=event_color,
-                outline="",
-            )
+    def create_event_chip(self, parent, row):
+        """Create a rounded event chip that can be pointed at any event"""
+        chip = {"event_id": None, "color": None}
 
-            # Add text
-            event_text = f"{event_time} {event['title']}"
-            event_text_id = event_canvas.create_text(
-                10,
-                event_height / 2,
-                text=event_text,
-                fill="white",
-                font=("SF Pro Display", 9),
-                anchor="w",
+        # Create the event with rounded corners using a Canvas; the width
+        # follows the cell through the <Configure> binding below
+        canvas = tk.Canvas(
+            parent, width=1, height=self.CHIP_HEIGHT, highlightthickness=0
+        )
+        canvas.grid(row=row, column=0, sticky="ew", pady=1)
+        chip["canvas"] = canvas
+
+        chip["rect"] = canvas.create_polygon(
+            self.rounded_rectangle_points(2, 0, 100, self.CHIP_HEIGHT, 6),
+            smooth=True,
+            outline="",
+        )
+        chip["text"] = canvas.create_text(
+            10,
+            self.CHIP_HEIGHT / 2,
+            fill="white",
+            font=("SF Pro Display", 9),
+            anchor="w",
+        )
+
+        def on_configure(e):
+            canvas.coords(
+                chip["rect"],
+                *self.rounded_rectangle_points(
+                    2, 0, max(e.width - 2, 14), self.CHIP_HEIGHT, 6
+                ),
             )
 
-            # Add hover effect
-            def on_enter(e, rect=event_rect, canvas=event_canvas, color=event_color):
-                # Darken the color slightly
-                r, g, b = canvas.winfo_rgb(color)
-                darker = f"#{int(r/65535*0.9):02x}{int(g/65535*0.9):02x}{int(b/65535*0.9):02x}"
-                canvas.itemconfig(rect, fill=darker)
+        # Add hover effect
+        def on_enter(e):
+            # Darken the color slightly
+            r, g, b = canvas.winfo_rgb(chip["color"])
+            darker = f"#{int(r/257*0.9):02x}{int(g/257*0.9):02x}{int(b/257*0.9):02x}"
+            canvas.itemconfig(chip["rect"], fill=darker)
+
+        def on_leave(e):
+            canvas.itemconfig(chip["rect"], fill=chip["color"])
+
+        canvas.bind("<Configure>", on_configure)
+        canvas.bind("<Enter>", on_enter)
+        canvas.bind("<Leave>", on_leave)
+
+        # Bind click event to open the event
+        canvas.bind("<Button-1>", lambda e: self.app.edit_event(chip["event_id"]))
+
+        return chip
+
+    @staticmethod
+    def rounded_rectangle_points(x1, y1, x2, y2, radius):
+        """Get the polygon points of a rounded rectangle (for smooth=True)"""
+        return [
+            x1 + radius,
+            y1,
+            x2 - radius,
+            y1,
+            x2,
+            y1,
+            x2,
+            y1 + radius,
+            x2,
+            y2 - radius,
+            x2,
+            y2,
+            x2 - radius,
+            y2,
+            x1 + radius,
+            y2,
+            x1,
+            y2,
+            x1,
+            y2 - radius,
+            x1,
+            y1 + radius,
+            x1,
+            y1,
+        ]
+
+    def update_day_cell(self, cell, day, events, is_today, theme):
+        """Point a pooled cell at a day and its events"""
+        cell["day"] = day
+
+        if day is None:
+            cell["frame"].configure(style="Cell.TFrame")
+            cell["header"].grid_remove()
+            cell["event_frame"].grid_remove()
+            return
+
+        # Apply the cell style
+        cell["frame"].configure(style="TodayCell.TFrame" if is_today else "Cell.TFrame")
+        cell["header"].grid()
+        cell["event_frame"].grid()
+
+        # Show the day number, with a circular background if it's today
+        if is_today:
+            day_canvas = cell["day_canvas"]
+            day_canvas.configure(bg=theme["card"])
+            day_canvas.itemconfig(cell["day_circle"], fill=theme["accent"])
+            day_canvas.itemconfig(cell["day_text"], text=str(day))
+        else:
+            cell["day_label"].configure(text=str(day))
+
+        if is_today != cell["is_today"]:
+            if is_today:
+                cell["day_label"].pack_forget()
+                cell["day_canvas"].pack(side=tk.LEFT, padx=4, pady=2)
+            else:
+                cell["day_canvas"].pack_forget()
+                cell["day_label"].pack(side=tk.LEFT, padx=6, pady=2)
+            cell["is_today"] = is_today
 
-            def on_leave(e, rect=event_rect, canvas=event_canvas, color=event_color):
-                canvas.itemconfig(rect, fill=color)
+        # Sort events by start time
+        events.sort(key=lambda e: e.start)
 
-            event_canvas.bind("<Enter>", on_enter)
-            event_canvas.bind("<Leave>", on_leave)
+        # Display up to MAX_EVENTS events, with a "more" indicator if there are more
+        for i, chip in enumerate(cell["chips"]):
+            canvas = chip["canvas"]
+            if i >= len(events):
+                canvas.grid_remove()
+                continue
 
-            # Bind click event to open the event
-            event_canvas.bind(
-                "<Button-1>", lambda e, eid=event["id"]: self.app.edit_event(eid)
+            event = events[i]
+
+            # Get color based on priority or use a color from the palette
+            chip["color"] = event.color or self.app.theme_manager.get_event_color(
+                i, event.priority
             )
+            chip["event_id"] = event.id
 
-        # Show "more" indicator if there are more events
-        if len(events) > max_events:
-            more_container = tk.Frame(
-                event_frame,
-                background=theme["card"],
-                borderwidth=0,
-                highlightthickness=0,
+            canvas.configure(bg=theme["card"])
+            canvas.itemconfig(chip["rect"], fill=chip["color"])
+            canvas.itemconfig(
+                chip["text"], text=f"{event.start.strftime('%H:%M')} {event.title}"
             )
-            more_container.grid(row=max_events, column=0, sticky="ew", pady=1)
+            canvas.grid()
 
-            more_label = ttk.Label(
-                more_container,
-                text=self._("+ {} more").format(len(events) - max_events),
-                style="TLabel",
-                font=("SF Pro Display", 8),
+        more_label = cell["more_label"]
+        if len(events) > self.MAX_EVENTS:
+            more_label.configure(
+                text=self._("+ {} more").format(len(events) - self.MAX_EVENTS),
                 foreground=theme["accent"],
             )
-            more_label.pack(side=tk.LEFT, padx=5)
-
-            # Bind click to show all events for this day
-            more_label.bind("<Button-1>", lambda e, d=day: self.show_day_events(d))
-            more_container.bind("<Button-1>", lambda e, d=day: self.show_day_events(d))
-
-        # Make the entire cell clickable to add a new event
-        cell.bind("<Double-1>", lambda e: self.add_event_on_day(day))
-
-        return cell
+            more_label.grid()
+        else:
+            more_label.grid_remove()
 
     def add_event_on_day(self, day):
         """Open the event form pre-filled with the selected day"""
@@ -359,8 +502,6 @@ class MonthView(BaseCalendarView):
 
     def show_day_events(self, day):
         """Show all events for a specific day"""
-        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
-
         # Create a datetime for the selected day
         selected_date = datetime(self.current_date.year, self.current_date.month, day)
 
@@ -368,8 +509,17 @@ class MonthView(BaseCalendarView):
         start_date = selected_date.strftime("%Y-%m-%d 00:00:00")
         end_date = selected_date.strftime("%Y-%m-%d 23:59:59")
 
-        # Get events for this day
-        events = self.db_manager.get_events_by_date_range(start_date, end_date)
+        # Get events for this day on the database thread
+        self.app.async_db.submit(
+            "fetch_events",
+            start_date,
+            end_date,
+            callback=lambda events: self.open_day_window(selected_date, events),
+        )
+
+    def open_day_window(self, selected_date, events):
+        """Show a window listing the events of a day"""
+        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
 
         if not events:
             return
@@ -395,25 +545,8 @@ class MonthView(BaseCalendarView):
         )
         header_canvas.pack(fill=tk.X)
 
-        # Create gradient
-        header_canvas.update_idletasks()
-        width = header_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 550
-
         # Create gradient from top to bottom
-        for i in range(60):
-            # Calculate color based on position
-            r1, g1, b1 = header_canvas.winfo_rgb(theme["header"])
-            r2, g2, b2 = header_canvas.winfo_rgb(theme["bg"])
-
-            ratio = i / 60
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            header_canvas.create_line(0, i, width, i, fill=color)
+        self.app.theme_manager.gradients.attach(header_canvas, "header", "bg")
 
         # Add title
         header_canvas.create_text(
@@ -445,21 +578,17 @@ class MonthView(BaseCalendarView):
         canvas.create_window((0, 0), window=events_list_frame, anchor="nw")
 
         # Add events to the list
-        for i, event in enumerate(sorted(events, key=lambda e: e["start_time"])):
+        for i, event in enumerate(events):
             # Create an event card
             event_card = ttk.Frame(events_list_frame, style="Cell.TFrame", padding=15)
             event_card.pack(fill=tk.X, pady=8)
 
             # Event time
-            start_time = datetime.fromisoformat(event["start_time"])
-            end_time = datetime.fromisoformat(event["end_time"])
-
-            time_str = f"{start_time.strftime('%H:%M')} - {end_time.strftime('%H:%M')}"
+            time_str = f"{event.start.strftime('%H:%M')} - {event.end.strftime('%H:%M')}"
 
             # Get color based on priority or use a color from the palette
-            event_color = event.get(
-                "color",
-                self.app.theme_manager.get_event_color(i, event.get("priority")),
+            event_color = event.color or self.app.theme_manager.get_event_color(
+                i, event.priority
             )
 
             # Color indicator
@@ -472,7 +601,7 @@ class MonthView(BaseCalendarView):
 
             ttk.Label(
                 details_frame,
-                text=event["title"],
+                text=event.title,
                 style="TLabel",
                 font=("SF Pro Display", 13, "bold"),
             ).pack(anchor="w")
@@ -481,16 +610,16 @@ class MonthView(BaseCalendarView):
                 details_frame, text=time_str, style="TLabel", foreground=theme["accent"]
             ).pack(anchor="w", pady=(2, 0))
 
-            if event.get("location"):
+            if event.location:
                 ttk.Label(
                     details_frame,
-                    text=event["location"],
+                    text=event.location,
                     style="TLabel",
                     foreground=theme["fg"],
                 ).pack(anchor="w", pady=(5, 0))
 
-            if event.get("description"):
-                desc_text = event["description"]
+            if event.description:
+                desc_text = event.description
                 if len(desc_text) > 100:
                     desc_text = desc_text[:97] + "..."
 
@@ -507,13 +636,13 @@ class MonthView(BaseCalendarView):
                 event_card,
                 text=self._("Edit"),
                 style="iOS.Secondary.TButton",
-                command=lambda eid=event["id"]: self.app.edit_event(eid),
+                command=lambda eid=event.id: self.app.edit_event(eid),
             )
             edit_btn.pack(side=tk.RIGHT, padx=5)
 
             # Bind double-click to edit
             event_card.bind(
-                "<Double-1>", lambda e, eid=event["id"]: self.app.edit_event(eid)
+                "<Double-1>", lambda e, eid=event.id: self.app.edit_event(eid)
             )
 
         # Update the canvas scroll region
@@ -528,7 +657,7 @@ class MonthView(BaseCalendarView):
             button_frame,
             text=self._("Add Event"),
             style="iOS.TButton",
-            command=lambda: self.add_event_on_day(day),
+            command=lambda: self.add_event_on_day(selected_date.day),
         ).pack(side=tk.LEFT, padx=5)
 
         ttk.Button(
@@ -569,10 +698,14 @@ class MonthView(BaseCalendarView):
 
         self.refresh()
 
-    def get_date_range(self):
-        """Get the date range for the current month view"""
-        year = self.current_date.year
-        month = self.current_date.month
+    def get_date_range(self, offset=0):
+        """Get the date range for the current month view
+
+        offset selects a month before (negative) or after the current one.
+        """
+        month_index = self.current_date.month - 1 + offset
+        year = self.current_date.year + month_index // 12
+        month = month_index % 12 + 1
 
         # First day of the month
         first_day = datetime(year, month, 1)
@@ -610,9 +743,25 @@ class WeekView(BaseCalendarView):
             label.grid(row=hour, column=0, padx=5, pady=5, sticky="n")
             time_frame.rowconfigure(hour, weight=1)
 
-        # Create the calendar grid
-        self.calendar_frame = ttk.Frame(self, style="TFrame")
-        self.calendar_frame.grid(row=1, column=1, sticky="nsew", padx=15, pady=10)
+        # Create the calendar grid; hour lines, the today highlight and the
+        # events are all items on this one canvas
+        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+        self.grid_canvas = tk.Canvas(
+            self, width=1, height=1, bg=theme["bg"], highlightthickness=0
+        )
+        self.grid_canvas.grid(row=1, column=1, sticky="nsew", padx=15, pady=10)
+
+        self.event_font = tkfont.Font(family="SF Pro Display", size=9)
+        self.week_events = []
+        self.shown_week = None  # Monday of the week the events belong to
+        self.event_blocks = []  # (x1, y1, x2, y2, rect, color, event) per block
+        self.hover_block = None
+
+        self.grid_canvas.bind("<Configure>", lambda e: self.draw_grid())
+        self.grid_canvas.bind("<Button-1>", self.on_canvas_click)
+        self.grid_canvas.bind("<Double-1>", self.on_canvas_double_click)
+        self.grid_canvas.bind("<Motion>", self.on_canvas_motion)
+        self.grid_canvas.bind("<Leave>", lambda e: self.set_hover_block(None))
 
         # Create day headers (Mon, Tue, etc.)
         days_header = ttk.Frame(self, style="Header.TFrame")
@@ -631,15 +780,16 @@ class WeekView(BaseCalendarView):
         self.refresh()
 
     def refresh(self):
-        """Refresh the week view"""
-        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
-
-        # Clear the calendar frame
-        for widget in self.calendar_frame.winfo_children():
-            widget.destroy()
+        """Refresh the week view
 
+        Only the day headers, the today highlight and the event items are
+        redrawn; the hour grid is drawn by draw_grid when the canvas size
+        changes. The events are loaded on the database thread, and the
+        grid stays empty until they arrive when the week changes.
+        """
         # Get the week dates
         week_start, week_end, week_dates = self.get_week_dates()
+        today = datetime.now().date()
 
         # Update day headers
         for i, date in enumerate(week_dates):
@@ -648,226 +798,206 @@ class WeekView(BaseCalendarView):
             month_abbr = date.strftime("%b") if date.day == 1 or i == 0 else ""
 
             # Highlight today
-            is_today = (
-                date.year == datetime.now().year
-                and date.month == datetime.now().month
-                and date.day == datetime.now().day
-            )
-
-            header_style = "Today.TLabel" if is_today else "Header.TLabel"
+            header_style = "Today.TLabel" if date.date() == today else "Header.TLabel"
 
             self.day_labels[i].configure(
                 text=f"{day_name} {day_num} {month_abbr}", style=header_style
             )
 
+        self.draw_today()
+        if week_start != self.shown_week:
+            self.week_events = []
+            self.draw_events()
+            self.shown_week = week_start
+
         # Get events for this week
-        start_date = week_start.strftime("%Y-%m-%d 00:00:00")
-        end_date = week_end.strftime("%Y-%m-%d 23:59:59")
-        events = self.db_manager.get_events_by_date_range(start_date, end_date)
+        self.load_events(*self.get_date_range(), self.show_events)
+
+    def show_events(self, events):
+        """Draw the loaded events of the displayed week"""
+        self.week_events = events
+        self.draw_events()
+
+    def get_grid_metrics(self):
+        """Get the column width and hour height of the week grid"""
+        width = max(self.grid_canvas.winfo_width(), 7)
+        height = max(self.grid_canvas.winfo_height(), 24)
+        return width / 7, height / 24
+
+    def draw_grid(self):
+        """Draw the day columns and hour lines for the current canvas size"""
+        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+        canvas = self.grid_canvas
+        column_width, hour_height = self.get_grid_metrics()
+
+        canvas.delete("grid")
+        canvas.configure(bg=theme["bg"])
 
-        # Create the week grid
         for day in range(7):
-            # Check if this column is today
-            is_today_column = (
-                week_dates[day].year == datetime.now().year
-                and week_dates[day].month == datetime.now().month
-                and week_dates[day].day == datetime.now().day
+            x1 = day * column_width + 2
+            x2 = (day + 1) * column_width - 2
+            canvas.create_rectangle(
+                x1, 0, x2, 24 * hour_height - 1,
+                fill=theme["card"], outline=theme["border"], tags="grid"
             )
 
-            day_column = ttk.Frame(self.calendar_frame, style="TFrame")
-            day_column.grid(row=0, column=day, sticky="nsew", padx=2)
-            self.calendar_frame.columnconfigure(day, weight=1)
+            # Add a thin horizontal line at the top of each hour
+            for hour in range(1, 24):
+                y = hour * hour_height
+                canvas.create_line(x1, y, x2, y, fill=theme["border"], tags="grid")
 
-            # Create hour cells for this day
-            for hour in range(24):
-                cell_style = "TodayCell.TFrame" if is_today_column else "Cell.TFrame"
-                cell = ttk.Frame(day_column, style=cell_style, height=60)
-                cell.grid(row=hour, column=0, sticky="nsew", pady=1)
-                day_column.rowconfigure(hour, weight=1)
+        canvas.tag_lower("grid")
 
-                # Add a thin horizontal line at the top of each cell
-                separator = ttk.Separator(cell, orient="horizontal")
-                separator.place(relx=0, rely=0, relwidth=1, height=1)
+        self.draw_today()
+        self.draw_events()
 
-                # Make the cell clickable to add a new event
-                cell.bind(
-                    "<Double-1>", lambda e, d=day, h=hour: self.add_event_on_hour(d, h)
+    def draw_today(self):
+        """Outline today's column if it is in the displayed week"""
+        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+        canvas = self.grid_canvas
+        column_width, hour_height = self.get_grid_metrics()
+
+        canvas.delete("today")
+
+        _, _, week_dates = self.get_week_dates()
+        today = datetime.now().date()
+        for day, date in enumerate(week_dates):
+            if date.date() == today:
+                canvas.create_rectangle(
+                    day * column_width + 3, 1,
+                    (day + 1) * column_width - 3, 24 * hour_height - 2,
+                    outline=theme["accent"], width=2, tags="today"
                 )
 
-        # Add events to the grid
-        for event in events:
-            self.add_event_to_grid(event, week_dates)
+    def draw_events(self):
+        """Draw the events of the displayed week"""
+        canvas = self.grid_canvas
+        column_width, hour_height = self.get_grid_metrics()
 
-    def add_event_to_grid(self, event, week_dates):
-        """Add an event to the week grid"""
-        theme = self.app.theme_manager.themes[self.app.theme_manager.current_theme]
+        canvas.delete("event")
+        self.event_blocks = []
+        self.hover_block = None
 
-        start_time = datetime.fromisoformat(event["start_time"])
-        end_time = datetime.fromisoformat(event["end_time"])
+        _, _, week_dates = self.get_week_dates()
+        for event in self.week_events:
+            self.add_event_to_grid(event, week_dates, column_width, hour_height)
 
-        # Check if the event is in this week
-        event_date = start_time.date()
-        for day_idx, day_date in enumerate(week_dates):
-            if event_date == day_date.date():
-                # Calculate position and size
-                start_hour = start_time.hour + start_time.minute / 60
-                end_hour = end_time.hour + end_time.minute / 60
-
-                # Handle multi-day events
-                if end_time.date() > start_time.date():
-                    end_hour = 24.0
-
-                # Create event widget
-                day_column = self.calendar_frame.winfo_children()[day_idx]
-
-                # Calculate which hour cell to place it in and the height
-                start_cell = int(start_hour)
-                height_cells = max(1, end_hour - start_hour)
-
-                # Get color based on priority or use a color from the palette
-                event_color = event.get(
-                    "color",
-                    self.app.theme_manager.get_event_color(
-                        day_idx, event.get("priority")
-                    ),
-                )
+    def add_event_to_grid(self, event, week_dates, column_width, hour_height):
+        """Draw an event on the week grid, one block per day it covers"""
+        canvas = self.grid_canvas
 
-                # Create a frame for the event with rounded corners
-                event_frame = tk.Frame(
-                    day_column,
-                    background=theme["card"],
-                    borderwidth=0,
-                    highlightthickness=0,
-                )
+        start_time = event.start
+        end_time = event.end
 
-                # Position the event
-                top_position = start_hour - start_cell
-                height_percent = min(1.0, height_cells)
+        for day_idx, day_date in enumerate(week_dates):
+            day_end = day_date + timedelta(days=1)
+            segment_start = max(start_time, day_date)
+            segment_end = min(end_time, day_end)
+
+            # Multi-day events get a block on every day they cover; an event
+            # ending at midnight does not spill into the next day
+            if segment_start >= day_end or segment_end < segment_start:
+                continue
+            if segment_end == segment_start and segment_start != start_time:
+                continue
+
+            # Calculate position and size
+            start_hour = (segment_start - day_date).total_seconds() / 3600
+            end_hour = (segment_end - day_date).total_seconds() / 3600
+
+            # Keep short events tall enough for a line of text
+            min_height = self.event_font.metrics("linespace") + 4
+            x1 = day_idx * column_width + 0.05 * column_width
+            x2 = (day_idx + 1) * column_width - 0.05 * column_width
+            y1 = start_hour * hour_height + 1
+            y2 = min(
+                max(end_hour * hour_height - 1, y1 + min_height), 24 * hour_height - 1
+            )
 
-                event_frame.place(
-                    relx=0.05,
-                    rely=top_position / 1.0 + start_cell / 24.0,
-                    relwidth=0.9,
-                    relheight=height_percent / 24.0,
-                )
+            # Get color based on priority or use a color from the palette
+            event_color = event.color or self.app.theme_manager.get_event_color(
+                day_idx, event.priority
+            )
 
-                # Create a canvas for the rounded rectangle
-                event_canvas = tk.Canvas(
-                    event_frame, bg=theme["card"], highlightthickness=0
-                )
-                event_canvas.pack(fill=tk.BOTH, expand=True)
-
-                # Function to create rounded rectangle
-                def create_rounded_rectangle(
-                    canvas, x1, y1, x2, y2, radius=10, **kwargs
-                ):
-                    points = [
-                        x1 + radius,
-                        y1,
-                        x2 - radius,
-                        y1,
-                        x2,
-                        y1,
-                        x2,
-                        y1 + radius,
-                        x2,
-                        y2 - radius,
-                        x2,
-                        y2,
-                        x2 - radius,
-                        y2,
-                        x1 + radius,
-                        y2,
-                        x1,
-                        y2,
-                        x1,
-                        y2 - radius,
-                        x1,
-                        y1 + radius,
-                        x1,
-                        y1,
-                    ]
-                    return canvas.create_polygon(points, smooth=True, **kwargs)
-
-                # Draw the rounded rectangle
-                event_frame.update_idletasks()
-                width = event_frame.winfo_width()
-                height = event_frame.winfo_height()
-
-                if width > 0 and height > 0:
-                    event_rect = create_rounded_rectangle(
-                        event_canvas,
-                        0,
-                        0,
-                        width,
-                        height,
-                        radius=8,
-                        fill=event_color,
-                        outline="",
-                    )
+            # Draw the rounded rectangle
+            radius = min(8, (y2 - y1) / 2)
+            rect = canvas.create_polygon(
+                MonthView.rounded_rectangle_points(x1, y1, x2, y2, radius),
+                smooth=True,
+                fill=event_color,
+                outline="",
+                tags="event",
+            )
 
-                    # Add event details
-                    event_title = tk.Label(
-                        event_canvas,
-                        text=f"{start_time.strftime('%H:%M')} {event['title']}",
-                        background=event_color,
-                        foreground="white",
-                        anchor="w",
-                        font=("SF Pro Display", 9),
-                        padx=6,
-                        pady=2,
-                    )
-                    event_title.place(relx=0, rely=0, relwidth=1, relheight=1)
-
-                    # Add hover effect
-                    def on_enter(
-                        e,
-                        rect=event_rect,
-                        canvas=event_canvas,
-                        color=event_color,
-                        label=event_title,
-                    ):
-                        # Darken the color slightly
-                        r, g, b = canvas.winfo_rgb(color)
-                        darker = f"#{int(r/65535*0.9):02x}{int(g/65535*0.9):02x}{int(b/65535*0.9):02x}"
-                        canvas.itemconfig(rect, fill=darker)
-                        label.config(background=darker)
-
-                    def on_leave(
-                        e,
-                        rect=event_rect,
-                        canvas=event_canvas,
-                        color=event_color,
-                        label=event_title,
-                    ):
-                        canvas.itemconfig(rect, fill=color)
-                        label.config(background=color)
-
-                    event_canvas.bind("<Enter>", on_enter)
-                    event_canvas.bind("<Leave>", on_leave)
-                    event_title.bind("<Enter>", on_enter)
-                    event_title.bind("<Leave>", on_leave)
-
-                # Bind click event to open the event
-                event_canvas.bind(
-                    "<Button-1>", lambda e, eid=event["id"]: self.app.edit_event(eid)
-                )
-                event_title.bind(
-                    "<Button-1>", lambda e, eid=event["id"]: self.app.edit_event(eid)
-                )
+            # Add event details
+            canvas.create_text(
+                x1 + 6,
+                y1 + 2,
+                text=self.fit_text(
+                    f"{start_time.strftime('%H:%M')} {event.title}", x2 - x1 - 12
+                ),
+                fill="white",
+                font=self.event_font,
+                anchor="nw",
+                tags="event",
+            )
 
-                # If the event spans multiple days, add it to the next day too
-                if end_time.date() > start_time.date() and day_idx < 6:
-                    next_day_event = event.copy()
-                    next_day_start = datetime.combine(
-                        week_dates[day_idx + 1].date(), datetime.min.time()
-                    )
-                    next_day_event["start_time"] = next_day_start.isoformat()
+            self.event_blocks.append((x1, y1, x2, y2, rect, event_color, event))
+
+    def fit_text(self, text, width):
+        """Truncate text with an ellipsis so it fits in width pixels"""
+        if self.event_font.measure(text) <= width:
+            return text
+        while text and self.event_font.measure(text + "…") > width:
+            text = text[:-1]
+        return text + "…" if text else ""
+
+    def find_event_block(self, x, y):
+        """Hit-test the drawn event blocks; the topmost block wins"""
+        for block in reversed(self.event_blocks):
+            x1, y1, x2, y2 = block[:4]
+            if x1 <= x <= x2 and y1 <= y <= y2:
+                return block
+        return None
+
+    def set_hover_block(self, block):
+        """Darken the event block under the mouse pointer"""
+        if block is self.hover_block:
+            return
 
-                    # Recursively add to the next day
-                    self.add_event_to_grid(next_day_event, week_dates)
+        canvas = self.grid_canvas
+        if self.hover_block is not None:
+            rect, color = self.hover_block[4:6]
+            canvas.itemconfig(rect, fill=color)
+
+        if block is not None:
+            rect, color = block[4:6]
+            # Darken the color slightly
+            r, g, b = canvas.winfo_rgb(color)
+            darker = f"#{int(r/257*0.9):02x}{int(g/257*0.9):02x}{int(b/257*0.9):02x}"
+            canvas.itemconfig(rect, fill=darker)
+
+        self.hover_block = block
+
+    def on_canvas_motion(self, event):
+        """Update the hover highlight as the mouse moves over the grid"""
+        self.set_hover_block(self.find_event_block(event.x, event.y))
+
+    def on_canvas_click(self, event):
+        """Open the event under the mouse pointer"""
+        block = self.find_event_block(event.x, event.y)
+        if block is not None:
+            self.app.edit_event(block[6].id)
+
+    def on_canvas_double_click(self, event):
+        """Add an event at the hour cell under the mouse pointer"""
+        if self.find_event_block(event.x, event.y) is not None:
+            return
 
-                break
+        column_width, hour_height = self.get_grid_metrics()
+        day = min(int(event.x // column_width), 6)
+        hour = min(int(event.y // hour_height), 23)
+        self.add_event_on_hour(day, hour)
 
     def add_event_on_hour(self, day, hour):
         """Open the event form pre-filled with the selected day and hour"""
@@ -928,9 +1058,14 @@ class WeekView(BaseCalendarView):
         self.current_date += timedelta(days=7)
         self.refresh()
 
-    def get_date_range(self):
-        """Get the date range for the current week view"""
+    def get_date_range(self, offset=0):
+        """Get the date range for the current week view
+
+        offset selects a week before (negative) or after the current one.
+        """
         week_start, week_end, _ = self.get_week_dates()
+        week_start += timedelta(weeks=offset)
+        week_end += timedelta(weeks=offset)
 
         return (
             week_start.strftime("%Y-%m-%d 00:00:00"),
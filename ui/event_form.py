@@ -2,6 +2,15 @@ import tkinter as tk
 from tkinter import ttk, colorchooser, messagebox
 from datetime import datetime, timedelta
 
+# Minutes-before choices offered for new reminders
+REMINDER_PRESETS = [0, 5, 10, 15, 30, 60, 120, 1440]
+
+# Reminder channel -> label; "window" always uses the in-app popup
+REMINDER_CHANNELS = {
+    "notification": "Notification",
+    "window": "Popup window",
+}
+
 
 class EventForm:
     """Form for creating and editing events"""
@@ -23,7 +32,7 @@ class EventForm:
             if not event_data or "id" not in event_data
             else self._("Edit Event")
         )
-        self.window.geometry("650x650")
+        self.window.geometry("650x720")
         self.window.transient(parent)
         self.window.grab_set()
 
@@ -53,26 +62,10 @@ class EventForm:
         )
         header_canvas.pack(fill=tk.X)
 
-        # Create gradient
-        header_canvas.update_idletasks()
-        width = header_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 650
-
-        # Create gradient from left to right
-        for i in range(width):
-            # Calculate color based on position
-            r1, g1, b1 = header_canvas.winfo_rgb(self.theme["bg"])
-            r2, g2, b2 = header_canvas.winfo_rgb(self.theme["accent"])
-
-            # Adjust the gradient to be subtle
-            ratio = i / width * 0.2  # Only go 20% toward the accent color
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            header_canvas.create_line(i, 0, i, 60, fill=color)
+        # Create gradient from left to right, only 20% toward the accent color
+        self.app.theme_manager.gradients.attach(
+            header_canvas, "bg", "accent", vertical=False, strength=0.2
+        )
 
         # Add title
         header_text = (
@@ -742,9 +735,80 @@ class EventForm:
         if not self.is_recurring_var.get():
             self.recurring_options_frame.grid_remove()
 
+        # Reminders
+        ttk.Label(
+            main_frame,
+            text=self._("Reminders:"),
+            style="TLabel",
+            font=("SF Pro Display", 13, "bold"),
+        ).grid(row=10, column=0, sticky="nw", pady=(0, 15))
+        reminders_frame = ttk.Frame(main_frame, style="TFrame")
+        reminders_frame.grid(row=10, column=1, sticky="ew", pady=(0, 15))
+
+        if "id" in self.event_data:
+            # None until they are loaded on the database thread
+            self.reminders = None
+            self.app.async_db.submit(
+                "get_reminders",
+                self.event_data["id"],
+                callback=self.on_reminders_loaded,
+            )
+        else:
+            self.reminders = [
+                {
+                    "offset_minutes": int(
+                        self.db_manager.get_setting("notification_time") or "15"
+                    ),
+                    "channel": "notification",
+                }
+            ]
+
+        # One line per reminder, rebuilt by update_reminders_list
+        self.reminders_list_frame = ttk.Frame(reminders_frame, style="TFrame")
+        self.reminders_list_frame.pack(fill=tk.X)
+
+        add_reminder_frame = ttk.Frame(reminders_frame, style="TFrame")
+        add_reminder_frame.pack(fill=tk.X, pady=(5, 0))
+
+        self.reminder_offset_var = tk.StringVar(value="15")
+        reminder_offset_frame = ttk.Frame(add_reminder_frame, style="Cell.TFrame")
+        reminder_offset_frame.pack(side=tk.LEFT)
+        ttk.Combobox(
+            reminder_offset_frame,
+            textvariable=self.reminder_offset_var,
+            values=[str(minutes) for minutes in REMINDER_PRESETS],
+            width=5,
+            font=("SF Pro Display", 12),
+        ).pack(side=tk.LEFT, padx=1, pady=1)
+
+        ttk.Label(
+            add_reminder_frame, text=self._("minutes before"), style="TLabel"
+        ).pack(side=tk.LEFT, padx=5)
+
+        self.reminder_channel_var = tk.StringVar(value=self._("Notification"))
+        reminder_channel_frame = ttk.Frame(add_reminder_frame, style="Cell.TFrame")
+        reminder_channel_frame.pack(side=tk.LEFT, padx=(0, 10))
+        ttk.Combobox(
+            reminder_channel_frame,
+            textvariable=self.reminder_channel_var,
+            values=[self._(label) for label in REMINDER_CHANNELS.values()],
+            state="readonly",
+            width=12,
+            font=("SF Pro Display", 12),
+        ).pack(side=tk.LEFT, padx=1, pady=1)
+
+        ttk.Button(
+            add_reminder_frame,
+            text=self._("Add"),
+            style="iOS.Secondary.TButton",
+            command=self.add_reminder,
+        ).pack(side=tk.LEFT)
+
+        self.update_reminders_list()
+
         # Buttons
         button_frame = ttk.Frame(main_frame, style="TFrame")
-        button_frame.grid(row=10, column=0, columnspan=2, sticky="ew", pady=(20, 0))
+        button_frame.grid(row=11, column=0, columnspan=2, sticky="ew", pady=(20, 0))
 
         # Add delete button if editing an existing event
         if self.event_data and "id" in self.event_data:
@@ -770,12 +834,97 @@ class EventForm:
             command=self.window.destroy,
         ).pack(side=tk.RIGHT, padx=5)
 
-        ttk.Button(
+        self.save_button = ttk.Button(
             button_frame,
             text=self._("Save"),
             style="iOS.TButton",
             command=self.save_event,
-        ).pack(side=tk.RIGHT, padx=5)
+        )
+        self.save_button.pack(side=tk.RIGHT, padx=5)
+
+    def on_reminders_loaded(self, reminders):
+        """Show the reminders of the event once they are loaded"""
+        self.reminders = reminders
+        if self.window.winfo_exists():
+            self.update_reminders_list()
+
+    def update_reminders_list(self):
+        """Show the reminders attached to the event"""
+        for widget in self.reminders_list_frame.winfo_children():
+            widget.destroy()
+
+        if self.reminders is None:
+            ttk.Label(
+                self.reminders_list_frame, text=self._("Loading..."), style="TLabel"
+            ).pack(anchor="w")
+            return
+
+        if not self.reminders:
+            ttk.Label(
+                self.reminders_list_frame, text=self._("No reminders"), style="TLabel"
+            ).pack(anchor="w")
+            return
+
+        for reminder in self.reminders:
+            row = ttk.Frame(self.reminders_list_frame, style="TFrame")
+            row.pack(fill=tk.X, pady=1)
+
+            channel = REMINDER_CHANNELS.get(reminder["channel"], reminder["channel"])
+            ttk.Label(
+                row,
+                text=f"{reminder['offset_minutes']} {self._('minutes before')}"
+                f" ({self._(channel)})",
+                style="TLabel",
+            ).pack(side=tk.LEFT)
+
+            ttk.Button(
+                row,
+                text="×",
+                width=3,
+                style="iOS.Secondary.TButton",
+                command=lambda r=reminder: self.remove_reminder(r),
+            ).pack(side=tk.RIGHT)
+
+    def add_reminder(self):
+        """Add the reminder selected in the reminder controls"""
+        if self.reminders is None:
+            return  # Still loading
+
+        try:
+            offset = int(self.reminder_offset_var.get())
+        except ValueError:
+            messagebox.showerror(
+                self._("Error"), self._("Reminder time must be a number of minutes")
+            )
+            return
+
+        channel = next(
+            (
+                key
+                for key, label in REMINDER_CHANNELS.items()
+                if self._(label) == self.reminder_channel_var.get()
+            ),
+            "notification",
+        )
+        # An event has one reminder per offset; say so instead of dropping
+        # the second channel on save
+        if any(r["offset_minutes"] == offset for r in self.reminders):
+            messagebox.showerror(
+                self._("Error"),
+                self._("There is already a reminder {} minutes before").format(
+                    offset
+                ),
+            )
+            return
+
+        self.reminders.append({"offset_minutes": offset, "channel": channel})
+        self.reminders.sort(key=lambda r: r["offset_minutes"], reverse=True)
+        self.update_reminders_list()
+
+    def remove_reminder(self, reminder):
+        """Remove a reminder from the event"""
+        self.reminders.remove(reminder)
+        self.update_reminders_list()
 
     def choose_color(self):
         """Open color chooser dialog"""
@@ -815,26 +964,10 @@ class EventForm:
         )
         header_canvas.pack(fill=tk.X)
 
-        # Create gradient
-        header_canvas.update_idletasks()
-        width = header_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 400
-
-        # Create gradient from left to right
-        for i in range(width):
-            # Calculate color based on position
-            r1, g1, b1 = header_canvas.winfo_rgb(self.theme["bg"])
-            r2, g2, b2 = header_canvas.winfo_rgb(self.theme["accent"])
-
-            # Adjust the gradient to be subtle
-            ratio = i / width * 0.2  # Only go 20% toward the accent color
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            header_canvas.create_line(i, 0, i, 50, fill=color)
+        # Create gradient from left to right, only 20% toward the accent color
+        self.app.theme_manager.gradients.attach(
+            header_canvas, "bg", "accent", vertical=False, strength=0.2
+        )
 
         # Add title
         header_canvas.create_text(
@@ -1130,30 +1263,57 @@ class EventForm:
                 "recurrence_end_date": recurrence_end_date,
             }
 
-            # Save to database
+            # Existing reminders are kept if they have not loaded yet
+            if self.reminders is not None:
+                event_data["reminders"] = self.reminders
+
+            # Save on the database thread; the form stays open until it is done
+            self.save_button.state(["disabled"])
             if self.event_data and "id" in self.event_data:
                 # Update existing event
-                self.db_manager.update_event(self.event_data["id"], event_data)
-                messagebox.showinfo(
-                    self._("Success"), self._("Event updated successfully")
+                self.app.async_db.submit(
+                    "update_event",
+                    self.event_data["id"],
+                    event_data,
+                    callback=lambda result: self.on_saved(
+                        self._("Event updated successfully")
+                    ),
+                    errback=self.on_save_failed,
                 )
             else:
                 # Create new event
-                self.db_manager.add_event(event_data)
-                messagebox.showinfo(
-                    self._("Success"), self._("Event created successfully")
+                self.app.async_db.submit(
+                    "add_event",
+                    event_data,
+                    callback=lambda result: self.on_saved(
+                        self._("Event created successfully")
+                    ),
+                    errback=self.on_save_failed,
                 )
 
-            # Call the callback function if provided
-            if self.callback:
-                self.callback()
-
-            # Close the window
-            self.window.destroy()
-
         except ValueError as e:
             messagebox.showerror(self._("Error"), str(e))
 
+    def on_saved(self, message):
+        """Close the form after the event was saved"""
+        messagebox.showinfo(self._("Success"), message)
+        self.close_after_change()
+
+    def on_save_failed(self, error):
+        """Report a failed save and let the user try again"""
+        messagebox.showerror(self._("Error"), str(error))
+        if self.window.winfo_exists():
+            self.save_button.state(["!disabled"])
+
+    def close_after_change(self):
+        """Run the callback and close the form"""
+        # Call the callback function if provided
+        if self.callback:
+            self.callback()
+
+        # Close the window
+        self.window.destroy()
+
     def delete_event(self):
         """Delete the current event"""
         if "id" in self.event_data:
@@ -1161,14 +1321,12 @@ class EventForm:
                 self._("Confirm Deletion"),
                 self._("Are you sure you want to delete this event?"),
             ):
-                self.db_manager.delete_event(self.event_data["id"])
-
-                # Call the callback function if provided
-                if self.callback:
-                    self.callback()
-
-                # Close the window
-                self.window.destroy()
+                self.app.async_db.submit(
+                    "delete_event",
+                    self.event_data["id"],
+                    callback=lambda result: self.close_after_change(),
+                    errback=self.on_save_failed,
+                )
 
     def show_event_history(self):
         """Show the history of changes for this event"""
@@ -1203,26 +1361,10 @@ class EventForm:
         )
         header_canvas.pack(fill=tk.X)
 
-        # Create gradient
-        header_canvas.update_idletasks()
-        width = header_canvas.winfo_width()
-        if width < 10:  # If not yet rendered, use a default
-            width = 550
-
-        # Create gradient from left to right
-        for i in range(width):
-            # Calculate color based on position
-            r1, g1, b1 = header_canvas.winfo_rgb(self.theme["bg"])
-            r2, g2, b2 = header_canvas.winfo_rgb(self.theme["accent"])
-
-            # Adjust the gradient to be subtle
-            ratio = i / width * 0.2  # Only go 20% toward the accent color
-            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
-            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
-            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
-
-            color = f"#{r:02x}{g:02x}{b:02x}"
-            header_canvas.create_line(i, 0, i, 60, fill=color)
+        # Create gradient from left to right, only 20% toward the accent color
+        self.app.theme_manager.gradients.attach(
+            header_canvas, "bg", "accent", vertical=False, strength=0.2
+        )
 
         # Add title
         header_canvas.create_text(
@@ -0,0 +1,153 @@
+import math
+import tkinter as tk
+from collections import OrderedDict
+
+
+class GradientRenderer:
+    """Renders gradient backgrounds into cached PhotoImages
+
+    Each gradient is rendered once per (colors, size) with a single
+    PhotoImage.put call and kept in a small LRU cache, instead of being
+    drawn as one canvas line per pixel. Canvases registered with attach()
+    follow their own resizes and are repainted on theme changes.
+    """
+
+    def __init__(self, theme_manager, max_images=32):
+        """Initialize the renderer for a theme manager"""
+        self.theme_manager = theme_manager
+        self.max_images = max_images
+
+        self._images = OrderedDict()
+
+        # Attached canvas -> (gradient spec, image currently shown)
+        self._canvases = {}
+
+    def linear(self, start_color, end_color, width, height, vertical=True, strength=1.0):
+        """Get a linear gradient image
+
+        vertical gradients go from top to bottom, the others from left to
+        right; strength limits how far the gradient goes toward end_color.
+        """
+        key = ("linear", start_color, end_color, width, height, vertical, strength)
+        image = self._get(key)
+        if image is not None:
+            return image
+
+        steps = height if vertical else width
+        colors = self.blend(start_color, end_color, steps, strength)
+        if vertical:
+            data = " ".join("{%s}" % color for color in colors)  # One column
+        else:
+            data = "{%s}" % " ".join(colors)  # One row
+
+        # put tiles the single row or column over the whole image
+        image = tk.PhotoImage(master=self.theme_manager.root, width=width, height=height)
+        image.put(data, to=(0, 0, width, height))
+
+        self._store(key, image)
+        return image
+
+    def radial(self, inner_color, outer_color, width, height, center, radius):
+        """Get a radial gradient image that fades out at radius"""
+        key = ("radial", inner_color, outer_color, width, height, center, radius)
+        image = self._get(key)
+        if image is not None:
+            return image
+
+        # Render at half resolution and zoom, since the rings are smooth
+        # anyway and rendering is pure Python per pixel
+        scale = 2
+        small_radius = radius // scale
+        colors = self.blend(inner_color, outer_color, small_radius + 1)
+        center_x, center_y = center[0] / scale, center[1] / scale
+
+        rows = []
+        for y in range(-(-height // scale)):
+            dy = y - center_y
+            rows.append(
+                "{%s}"
+                % " ".join(
+                    colors[min(int(math.hypot(x - center_x, dy)), small_radius)]
+                    for x in range(-(-width // scale))
+                )
+            )
+
+        small = tk.PhotoImage(master=self.theme_manager.root)
+        small.put(" ".join(rows))
+        image = small.zoom(scale)
+
+        self._store(key, image)
+        return image
+
+    def blend(self, start_color, end_color, steps, strength=1.0):
+        """Get steps hex colors going from start_color toward end_color"""
+        r1, g1, b1 = self.theme_manager.root.winfo_rgb(start_color)
+        r2, g2, b2 = self.theme_manager.root.winfo_rgb(end_color)
+
+        colors = []
+        for i in range(steps):
+            ratio = i / max(steps - 1, 1) * strength
+            r = int(r1 * (1 - ratio) + r2 * ratio) >> 8
+            g = int(g1 * (1 - ratio) + g2 * ratio) >> 8
+            b = int(b1 * (1 - ratio) + b2 * ratio) >> 8
+            colors.append(f"#{r:02x}{g:02x}{b:02x}")
+        return colors
+
+    def attach(self, canvas, start_key, end_key, vertical=True, strength=1.0):
+        """Paint a themed linear gradient behind the items of a canvas
+
+        start_key and end_key are theme color names such as "header" or
+        "accent", so the gradient follows theme changes.
+        """
+        self._canvases[canvas] = ((start_key, end_key, vertical, strength), None)
+        canvas.bind("<Configure>", lambda e: self.paint(canvas), add="+")
+        canvas.bind("<Destroy>", lambda e: self._canvases.pop(canvas, None), add="+")
+        self.paint(canvas)
+
+    def paint(self, canvas):
+        """Render the gradient of an attached canvas for its current size"""
+        if canvas not in self._canvases:
+            return
+
+        (start_key, end_key, vertical, strength), _ = self._canvases[canvas]
+        theme = self.theme_manager.themes[self.theme_manager.current_theme]
+
+        # Before the first <Configure> the canvas only has its requested size
+        width = canvas.winfo_width()
+        height = canvas.winfo_height()
+        if width < 2 or height < 2:
+            width = canvas.winfo_reqwidth()
+            height = canvas.winfo_reqheight()
+
+        image = self.linear(
+            theme[start_key], theme[end_key], width, height, vertical, strength
+        )
+
+        items = canvas.find_withtag("gradient")
+        if items:
+            canvas.itemconfig(items[0], image=image)
+        else:
+            canvas.create_image(0, 0, image=image, anchor="nw", tags="gradient")
+            canvas.tag_lower("gradient")
+
+        # Keep a reference so the image outlives its cache entry
+        self._canvases[canvas] = (self._canvases[canvas][0], image)
+
+    def repaint_all(self):
+        """Re-render every attached canvas, e.g. after a theme change"""
+        self._images.clear()
+        for canvas in list(self._canvases):
+            self.paint(canvas)
+
+    def _get(self, key):
+        """Look up a cached image and mark it as recently used"""
+        image = self._images.get(key)
+        if image is not None:
+            self._images.move_to_end(key)
+        return image
+
+    def _store(self, key, image):
+        """Cache an image, evicting the least recently used ones"""
+        self._images[key] = image
+        while len(self._images) > self.max_images:
+            self._images.popitem(last=False)
@@ -2,6 +2,8 @@ import tkinter as tk
 from tkinter import ttk
 import os
 
+from ui.gradients import GradientRenderer
+
 
 class ThemeManager:
     """Manages application themes (light/dark)"""
@@ -69,6 +71,15 @@ class ThemeManager:
             },
         }
 
+        # Shared renderer for the gradient backgrounds of headers and bars
+        self.gradients = GradientRenderer(self)
+
+        # Classic Tk widgets and canvas items colored from the theme, mapped
+        # to {option: theme color name}, and callbacks run on theme changes
+        self._styled_widgets = {}
+        self._styled_items = {}
+        self._listeners = []
+
         # Load the saved theme or use light theme as default
         self.current_theme = self.db_manager.get_setting("theme") or "light"
 
@@ -363,11 +374,59 @@ class ThemeManager:
         # Update the current theme
         self.current_theme = theme_name
 
+        # Recolor the classic Tk widgets and canvases in place
+        for widget, options in list(self._styled_widgets.items()):
+            widget.configure(**self.resolve_colors(options))
+        for (canvas, item), options in list(self._styled_items.items()):
+            canvas.itemconfig(item, **self.resolve_colors(options))
+
+        # Re-render the gradients for the new colors
+        self.gradients.repaint_all()
+
+        for listener in self._listeners:
+            listener()
+
     def set_theme(self, theme_name):
         """Set and apply a new theme"""
         self.apply_theme(theme_name)
         self.db_manager.update_setting("theme", theme_name)
 
+    def resolve_colors(self, options):
+        """Map {option: theme color name} to {option: color} for the current theme"""
+        theme = self.themes[self.current_theme]
+        return {option: theme[key] for option, key in options.items()}
+
+    def style_widget(self, widget, **options):
+        """Color a classic Tk widget from the theme and keep it in sync
+
+        options map widget options to theme color names, e.g. bg="header".
+        """
+        self._styled_widgets[widget] = options
+        widget.configure(**self.resolve_colors(options))
+
+        def forget(e):
+            if e.widget is widget:
+                self._styled_widgets.pop(widget, None)
+
+        widget.bind("<Destroy>", forget, add="+")
+
+    def style_canvas_item(self, canvas, item, **options):
+        """Color a canvas item from the theme and keep it in sync"""
+        if not any(key[0] is canvas for key in self._styled_items):
+            canvas.bind("<Destroy>", lambda e: self._forget_canvas(canvas), add="+")
+
+        self._styled_items[(canvas, item)] = options
+        canvas.itemconfig(item, **self.resolve_colors(options))
+
+    def _forget_canvas(self, canvas):
+        """Stop tracking the items of a destroyed canvas"""
+        for key in [key for key in self._styled_items if key[0] is canvas]:
+            del self._styled_items[key]
+
+    def add_theme_listener(self, callback):
+        """Call callback() after every theme change"""
+        self._listeners.append(callback)
+
     def get_event_color(self, index=None, priority=None):
         """Get a color for an event based on index or priority"""
         theme = self.themes[self.current_theme]
@@ -124,7 +124,18 @@ class I18nManager:
             "Version 1.0.0": "Versión 1.0.0",
             "+ {} more": "+ {} más",
             "Do you want to export all events?": "¿Desea exportar todos los eventos?",
-            "Selecting 'No' will export only events in the current view.": "Seleccionar 'No' exportará solo los eventos en la vista actual."
+            "Selecting 'No' will export only events in the current view.": "Seleccionar 'No' exportará solo los eventos en la vista actual.",
+            "No events found": "No se encontraron eventos",
+            "Reminders:": "Recordatorios:",
+            "minutes before": "minutos antes",
+            "Notification": "Notificación",
+            "Popup window": "Ventana emergente",
+            "Add": "Añadir",
+            "No reminders": "Sin recordatorios",
+            "Reminder time must be a number of minutes": "El tiempo del recordatorio debe ser un número de minutos",
+            "There is already a reminder {} minutes before": "Ya hay un recordatorio {} minutos antes",
+            "Loading...": "Cargando...",
+            "Could not load events": "No se pudieron cargar los eventos"
         }
         
         # Create a custom translation class
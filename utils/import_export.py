@@ -37,7 +37,12 @@ class ImportExportManager:
         with open(file_path, 'rb') as f:
             cal = Calendar.from_ical(f.read())
         
-        count = 0
+        # Add all events to the database in batched transactions
+        event_ids = self.db_manager.add_events_bulk(self.iter_ical_events(cal))
+        return len(event_ids)
+    
+    def iter_ical_events(self, cal):
+        """Yield event data for every VEVENT in a parsed calendar"""
         for component in cal.walk():
             if component.name == "VEVENT":
                 # Extract event data
@@ -90,11 +95,7 @@ class ImportExportManager:
                     "recurrence_end_date": recurrence_end_date
                 }
                 
-                # Add to database
-                self.db_manager.add_event(event_data)
-                count += 1
-        
-        return count
+                yield event_data
     
     def import_from_csv(self, file_path):
         """Import events from a CSV file"""
@@ -107,45 +108,46 @@ class ImportExportManager:
                 if field not in reader.fieldnames:
                     raise ValueError(f"CSV file is missing required field: {field}")
             
-            count = 0
-            for row in reader:
-                # Extract event data
-                title = row.get('title', '').strip()
-                if not title:
-                    continue  # Skip events without a title
-                
-                # Parse start and end times
-                try:
-                    start_time = self.parse_datetime(row.get('start_time', ''))
-                    
-                    # If end_time is not provided, default to start_time + 1 hour
-                    if 'end_time' in row and row['end_time'].strip():
-                        end_time = self.parse_datetime(row['end_time'])
-                    else:
-                        end_time = start_time + timedelta(hours=1)
-                except ValueError as e:
-                    # Skip events with invalid dates
-                    continue
-                
-                # Create event data
-                event_data = {
-                    "title": title,
-                    "description": row.get('description', '').strip(),
-                    "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
-                    "location": row.get('location', '').strip(),
-                    "priority": row.get('priority', 'medium').strip().lower(),
-                    "color": row.get('color', '#3498db').strip(),
-                    "is_recurring": row.get('is_recurring', '').lower() in ('true', 'yes', '1'),
-                    "recurrence_type": row.get('recurrence_type', '').strip().lower() or None,
-                    "recurrence_end_date": self.parse_datetime(row.get('recurrence_end_date', '')).strftime("%Y-%m-%d %H:%M:%S") if row.get('recurrence_end_date', '').strip() else None
-                }
+            # Add all events to the database in batched transactions
+            event_ids = self.db_manager.add_events_bulk(self.iter_csv_events(reader))
+            return len(event_ids)
+    
+    def iter_csv_events(self, reader):
+        """Yield event data for every valid row of a CSV reader"""
+        for row in reader:
+            # Extract event data
+            title = row.get('title', '').strip()
+            if not title:
+                continue  # Skip events without a title
+            
+            # Parse start and end times
+            try:
+                start_time = self.parse_datetime(row.get('start_time', ''))
                 
-                # Add to database
-                self.db_manager.add_event(event_data)
-                count += 1
+                # If end_time is not provided, default to start_time + 1 hour
+                if 'end_time' in row and row['end_time'].strip():
+                    end_time = self.parse_datetime(row['end_time'])
+                else:
+                    end_time = start_time + timedelta(hours=1)
+            except ValueError as e:
+                # Skip events with invalid dates
+                continue
+            
+            # Create event data
+            event_data = {
+                "title": title,
+                "description": row.get('description', '').strip(),
+                "start_time": start_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "end_time": end_time.strftime("%Y-%m-%d %H:%M:%S"),
+                "location": row.get('location', '').strip(),
+                "priority": row.get('priority', 'medium').strip().lower(),
+                "color": row.get('color', '#3498db').strip(),
+                "is_recurring": row.get('is_recurring', '').lower() in ('true', 'yes', '1'),
+                "recurrence_type": row.get('recurrence_type', '').strip().lower() or None,
+                "recurrence_end_date": self.parse_datetime(row.get('recurrence_end_date', '')).strftime("%Y-%m-%d %H:%M:%S") if row.get('recurrence_end_date', '').strip() else None
+            }
             
-            return count
+            yield event_data
     
     def parse_datetime(self, date_string):
         """Parse a datetime string in various formats"""
@@ -173,7 +175,7 @@ class ImportExportManager:
         raise ValueError(f"Could not parse date: {date_string}")
     
     def export_to_csv(self, events, file_path):
-        """Export events to a CSV file"""
+        """Export Event objects to a CSV file"""
         fieldnames = [
             'title', 'description', 'start_time', 'end_time', 'location',
             'priority', 'color', 'is_recurring', 'recurrence_type', 'recurrence_end_date'
@@ -184,14 +186,15 @@ class ImportExportManager:
             writer.writeheader()
             
             for event in events:
+                row = {field: getattr(event, field) for field in fieldnames}
+                
                 # Convert boolean to string
-                event_copy = event.copy()
-                event_copy['is_recurring'] = 'yes' if event_copy.get('is_recurring') else 'no'
+                row['is_recurring'] = 'yes' if event.is_recurring else 'no'
                 
-                writer.writerow(event_copy)
+                writer.writerow(row)
     
     def export_to_ical(self, events, file_path):
-        """Export events to an iCalendar file"""
+        """Export Event objects to an iCalendar file"""
         if not ICAL_AVAILABLE:
             raise ImportError("icalendar package is not installed. Please install it with 'pip install icalendar'")
         
@@ -203,25 +206,23 @@ class ImportExportManager:
             event = Event()
             
             # Add basic event properties
-            event.add('summary', event_data['title'])
-            event.add('description', event_data.get('description', ''))
-            event.add('location', event_data.get('location', ''))
+            event.add('summary', event_data.title)
+            event.add('description', event_data.description or '')
+            event.add('location', event_data.location or '')
             
             # Add start and end times
-            start_time = datetime.fromisoformat(event_data['start_time'])
-            end_time = datetime.fromisoformat(event_data['end_time'])
-            event.add('dtstart', start_time)
-            event.add('dtend', end_time)
+            event.add('dtstart', event_data.start)
+            event.add('dtend', event_data.end)
             
             # Add creation timestamp
             event.add('dtstamp', datetime.now())
             
             # Add a unique identifier
-            event.add('uid', f"{event_data['id']}@calendarapp")
+            event.add('uid', f"{event_data.id}@calendarapp")
             
             # Add recurrence rule if applicable
-            if event_data.get('is_recurring'):
-                recurrence_type = event_data.get('recurrence_type', 'daily')
+            if event_data.is_recurring:
+                recurrence_type = event_data.recurrence_type or 'daily'
                 
                 # Map recurrence type to iCalendar frequency
                 freq_map = {
@@ -237,8 +238,8 @@ class ImportExportManager:
                 rrule = {'FREQ': [freq]}
                 
                 # Add end date if available
-                if event_data.get('recurrence_end_date'):
-                    until = datetime.fromisoformat(event_data['recurrence_end_date'])
+                if event_data.recurrence_end_date:
+                    until = datetime.fromisoformat(event_data.recurrence_end_date)
                     rrule['UNTIL'] = [until]
                 
                 event.add('rrule', rrule)
@@ -0,0 +1,123 @@
+import queue
+import sqlite3
+import threading
+
+
+class LiveSearch:
+    """Runs search-as-you-type queries on a background thread
+
+    Keystrokes are debounced on the Tk side, the query runs on a worker
+    thread through its own read connection of the shared DatabaseManager,
+    and results are handed back to the Tk thread in small chunks through
+    root.after. Every new keystroke bumps a generation counter; a query or
+    chunk from an older generation is dropped, and a query still running in
+    SQLite is interrupted.
+    """
+
+    def __init__(self, root, db_manager, on_results, delay=250, limit=50, chunk_size=10):
+        """Initialize the live search and start its worker thread
+
+        on_results is called on the Tk thread as on_results(events, first,
+        done) with the results of the latest query in chunks; first marks
+        the chunk that should replace whatever was shown before and done
+        marks the last chunk.
+        """
+        self.root = root
+        self.db_manager = db_manager
+        self.on_results = on_results
+        self.delay = delay
+        self.limit = limit
+        self.chunk_size = chunk_size
+
+        self._generation = 0
+        self._pending = None
+        self._requests = queue.Queue()
+        self._conn = None
+
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+
+    def schedule(self, search_term, start_date=None, end_date=None):
+        """Search for a term once typing pauses for the debounce delay"""
+        generation = self._cancel_pending()
+        self._pending = self.root.after(
+            self.delay,
+            lambda: self._requests.put(
+                (generation, search_term, start_date, end_date)
+            ),
+        )
+
+    def cancel(self):
+        """Drop any pending or running query"""
+        self._cancel_pending()
+
+    def close(self):
+        """Stop the worker thread"""
+        self._cancel_pending()
+        self._requests.put(None)
+
+    def _cancel_pending(self):
+        """Invalidate older queries and return the new generation"""
+        self._generation += 1
+        if self._pending is not None:
+            self.root.after_cancel(self._pending)
+            self._pending = None
+
+        # Stop a stale query that is still running in SQLite
+        if self._conn is not None:
+            self._conn.interrupt()
+
+        return self._generation
+
+    def _run(self):
+        """Worker loop, executed on the search thread"""
+        db_manager = self.db_manager
+        # The read connection of this thread, which search queries use
+        self._conn = db_manager.conn
+
+        while True:
+            request = self._requests.get()
+
+            # Skip straight to the newest request if several queued up
+            while request is not None and not self._requests.empty():
+                request = self._requests.get()
+
+            if request is None:
+                break
+
+            generation, search_term, start_date, end_date = request
+            if generation != self._generation:
+                continue
+
+            try:
+                events = db_manager.search_events(
+                    search_term, start_date, end_date, limit=self.limit
+                )
+            except sqlite3.Error as e:
+                # Interrupted by a newer keystroke
+                if "interrupt" in str(e) and generation != self._generation:
+                    continue
+                # Anything else goes to Tk's error reporting, and the worker
+                # keeps serving the next keystrokes
+                self.root.after(0, self._fail, e)
+                continue
+
+            # Stream the results back a chunk at a time
+            for i in range(0, len(events), self.chunk_size) or [0]:
+                if generation != self._generation:
+                    break
+                chunk = events[i:i + self.chunk_size]
+                done = i + self.chunk_size >= len(events)
+                self.root.after(0, self._deliver, generation, chunk, i == 0, done)
+
+        self._conn = None
+        db_manager.close_thread_connection()
+
+    def _fail(self, error):
+        """Raise a search error on the Tk thread"""
+        raise error
+
+    def _deliver(self, generation, events, first, done):
+        """Pass a chunk of results to the callback, on the Tk thread"""
+        if generation == self._generation:
+            self.on_results(events, first, done)
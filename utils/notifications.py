@@ -1,6 +1,10 @@
 from datetime import datetime, timedelta
-import tkinter as tk
-from tkinter import ttk
+import heapq
+import queue
+import threading
+import time
+
+from utils.recurrence import TIME_FORMAT
 
 # Try to import plyer for notifications
 try:
@@ -9,54 +13,290 @@ try:
 except ImportError:
     PLYER_AVAILABLE = False
 
+# How long the schedule is kept before it is reloaded, and how late an
+# overdue reminder may still fire if its event has not started
+SCHEDULE_WINDOW = timedelta(days=1)
+
+# Reminders loaded into the schedule at once
+SCHEDULE_BATCH = 100
+
+# Reminders waiting for the delivery worker; more are dropped
+DELIVERY_QUEUE_SIZE = 100
+
+# Longest the timer sleeps between clock checks, so a suspend or a clock
+# change is noticed even when the next reminder is hours away
+CLOCK_CHECK_INTERVAL = timedelta(minutes=1)
+
+# A timer firing later than this means reminders may have been missed
+CLOCK_JUMP_TOLERANCE = timedelta(seconds=30)
+
+# Events listed in a digest of missed reminders before "+ N more"
+DIGEST_LINES = 5
+
 class NotificationManager:
     """Manages event notifications"""
     
-    def __init__(self, db_manager):
-        """Initialize the notification manager"""
+    def __init__(self, db_manager, root=None, fallback=None):
+        """Initialize the notification manager
+        
+        fallback(title, message) is called on the root's thread when no
+        system notification backend is available; it defaults to a Tk
+        window.
+        """
         self.db_manager = db_manager
-        self.notified_events = set()  # Keep track of events we've already notified about
+        self.root = root
+        self.fallback = fallback or self.show_custom_notification
+        
+        self._heap = []
+        self._timer = None
+        self._window_end = None
+        
+        # Wall clock time the timer was armed at and is due at
+        self._armed_at = None
+        self._due_at = None
+        
+        # Delivery counters and latencies (seconds from queueing to display)
+        self._metrics_lock = threading.Lock()
+        self._metrics = {
+            "queued": 0,
+            "delivered": 0,
+            "dropped": 0,
+            "failed": 0,
+            "max_queue_depth": 0,
+            "total_latency": 0.0,
+            "max_latency": 0.0,
+        }
+        
+        self._delivery_queue = queue.Queue(maxsize=DELIVERY_QUEUE_SIZE)
+        self._worker = threading.Thread(target=self._delivery_worker, daemon=True)
+        self._worker.start()
+    
+    def start(self):
+        """Load the schedule and re-arm it whenever events change"""
+        self.db_manager.add_change_listener(self.reschedule)
+        self.reschedule()
     
-    def check_and_notify(self, minutes_before=15):
-        """Check for upcoming events and show notifications"""
-        # Get events starting in the next X minutes
-        upcoming_events = self.db_manager.get_upcoming_events(minutes_before)
+    def reschedule(self):
+        """Reload the upcoming reminders and arm the timer for the first one"""
+        now = datetime.now()
         
-        for event in upcoming_events:
-            # Skip events we've already notified about
-            if event["id"] in self.notified_events:
-                continue
-            
-            # Show notification
-            self.show_notification(event)
-            
-            # Add to notified events
-            self.notified_events.add(event["id"])
+        # Reminders of occurrences that already started can't fire again
+        self.db_manager.expire_notifications(now.strftime(TIME_FORMAT))
+        
+        # Overdue reminders of events that have not started yet fire right away
+        reminders = self.db_manager.get_upcoming_reminders(
+            (now - SCHEDULE_WINDOW).strftime(TIME_FORMAT),
+            now.strftime(TIME_FORMAT),
+            SCHEDULE_BATCH,
+        )
+        
+        # The first four fields are unique, so the event dicts are never compared
+        self._heap = [
+            (datetime.fromisoformat(reminder["fire_time"]),
+             reminder["occurrence_id"], reminder["offset_minutes"],
+             reminder["channel"], reminder)
+            for reminder in reminders
+        ]
+        heapq.heapify(self._heap)
+        
+        # Load the next batch once this one runs out
+        self._window_end = now + SCHEDULE_WINDOW
+        if len(reminders) == SCHEDULE_BATCH:
+            self._window_end = min(
+                self._window_end, datetime.fromisoformat(reminders[-1]["fire_time"])
+            )
+        
+        self._arm()
+    
+    def _arm(self):
+        """Arm the timer for the next reminder or the end of the window"""
+        if self._timer is not None:
+            self.root.after_cancel(self._timer)
+        
+        now = datetime.now()
+        next_time = self._heap[0][0] if self._heap else self._window_end
+        next_time = max(now, min(next_time, now + CLOCK_CHECK_INTERVAL))
+        
+        self._armed_at = now
+        self._due_at = next_time
+        delay = (next_time - now).total_seconds()
+        self._timer = self.root.after(int(delay * 1000) + 1, self._on_timer)
+    
+    def _on_timer(self):
+        """Fire the reminders that are due and re-arm"""
+        self._timer = None
+        now = datetime.now()
+        
+        if now - self._due_at > CLOCK_JUMP_TOLERANCE:
+            # Slept or the clock jumped forward: everything since the timer
+            # was armed may have been missed
+            self.catch_up(self._armed_at, now)
+            self.reschedule()
+            return
+        
+        # Events written by another process, e.g. an import or a second app
+        # instance, don't reach the change listeners
+        if self.db_manager.has_external_changes():
+            self.reschedule()
+            return
+        
+        overdue = []
+        while self._heap and self._heap[0][0] <= now:
+            fire_time, _, minutes_before, _, event = heapq.heappop(self._heap)
+            if now - fire_time > CLOCK_JUMP_TOLERANCE:
+                overdue.append(event)
+            else:
+                self.notify_once(event, minutes_before)
+        self.notify_digest(overdue)
+        
+        if now >= self._window_end:
+            self.reschedule()
+        else:
+            self._arm()
     
-    def show_notification(self, event):
-        """Show a notification for an event"""
+    def catch_up(self, since, until):
+        """Show the reminders that fired between since and until as a digest"""
+        missed = self.db_manager.get_upcoming_reminders(
+            since.strftime(TIME_FORMAT),
+            since.strftime(TIME_FORMAT),
+            limit=None,
+            until=until.strftime(TIME_FORMAT),
+        )
+        self.notify_digest(missed)
+    
+    def notify_once(self, event, minutes_before):
+        """Show a reminder unless the ledger says it was already shown"""
+        if self.db_manager.claim_notification(
+            event["id"], event["start_time"], minutes_before
+        ):
+            self.show_notification(event, event.get("channel", "notification"))
+    
+    def notify_digest(self, reminders):
+        """Show several reminders at once, skipping those already shown"""
+        if not reminders:
+            return
+        
+        claimed = self.db_manager.claim_notifications(reminders)
+        if len(claimed) == 1:
+            self.show_notification(claimed[0], claimed[0]["channel"])
+        elif claimed:
+            self.show_digest(claimed)
+    
+    def show_notification(self, event, channel="notification"):
+        """Queue a notification for an event on the delivery worker
+        
+        The "notification" channel uses the system notifications when they
+        are available; "window" always uses the fallback window.
+        """
         title = event["title"]
         start_time = datetime.fromisoformat(event["start_time"]).strftime("%H:%M")
         message = f"Event at {start_time}: {title}"
         
-        if PLYER_AVAILABLE:
-            # Use plyer for system notifications
-            notification.notify(
-                title="Calendar Event Reminder",
-                message=message,
-                app_name="Calendar & Event Manager",
-                timeout=10
+        self._queue(title, message, channel)
+    
+    def show_digest(self, reminders):
+        """Queue one notification listing several reminders"""
+        title = f"{len(reminders)} missed reminders"
+        lines = [
+            f"{datetime.fromisoformat(reminder['start_time']):%a %H:%M} {reminder['title']}"
+            for reminder in reminders[:DIGEST_LINES]
+        ]
+        if len(reminders) > DIGEST_LINES:
+            lines.append(f"+ {len(reminders) - DIGEST_LINES} more")
+        
+        # Only skip the system notification if every reminder asked for that
+        channel = "notification"
+        if all(reminder["channel"] == "window" for reminder in reminders):
+            channel = "window"
+        
+        self._queue(title, "\n".join(lines), channel)
+    
+    def _queue(self, title, message, channel):
+        """Hand a notification to the delivery worker"""
+        try:
+            self._delivery_queue.put_nowait((time.monotonic(), title, message, channel))
+        except queue.Full:
+            self._record(dropped=1)
+            return
+        
+        with self._metrics_lock:
+            self._metrics["queued"] += 1
+            self._metrics["max_queue_depth"] = max(
+                self._metrics["max_queue_depth"], self._delivery_queue.qsize()
             )
-        else:
-            # Fallback to a custom notification window
-            self.show_custom_notification(title, message)
+    
+    def get_metrics(self):
+        """Get the delivery metrics
+        
+        Returns the counters plus the current queue depth and the average
+        and maximum delivery latency in milliseconds.
+        """
+        with self._metrics_lock:
+            metrics = dict(self._metrics)
+        
+        total_latency = metrics.pop("total_latency")
+        metrics["queue_depth"] = self._delivery_queue.qsize()
+        metrics["avg_latency_ms"] = (
+            total_latency / metrics["delivered"] * 1000 if metrics["delivered"] else 0.0
+        )
+        metrics["max_latency_ms"] = metrics.pop("max_latency") * 1000
+        return metrics
+    
+    def _delivery_worker(self):
+        """Deliver queued notifications, executed on the worker thread"""
+        while True:
+            queued_at, title, message, channel = self._delivery_queue.get()
+            
+            if PLYER_AVAILABLE and channel == "notification":
+                # Use plyer for system notifications
+                try:
+                    notification.notify(
+                        title=title,
+                        message=message,
+                        app_name="Calendar & Event Manager",
+                        timeout=10
+                    )
+                    self._record_delivery(queued_at)
+                    continue
+                except Exception:
+                    # No usable backend; fall back to the Tk window
+                    self._record(failed=1)
+            
+            if self.root is not None:
+                # Fallback to a custom notification window, on the Tk thread
+                self.root.after(0, self._show_custom_from_queue, queued_at, title, message)
+            else:
+                self._record(dropped=1)
+    
+    def _show_custom_from_queue(self, queued_at, title, message):
+        """Show a queued fallback notification, on the Tk thread"""
+        self.fallback(title, message)
+        self._record_delivery(queued_at)
+    
+    def _record_delivery(self, queued_at):
+        """Count a delivered notification and its latency"""
+        latency = time.monotonic() - queued_at
+        with self._metrics_lock:
+            self._metrics["delivered"] += 1
+            self._metrics["total_latency"] += latency
+            self._metrics["max_latency"] = max(self._metrics["max_latency"], latency)
+    
+    def _record(self, **counts):
+        """Add to the delivery counters"""
+        with self._metrics_lock:
+            for key, count in counts.items():
+                self._metrics[key] += count
     
     def show_custom_notification(self, title, message):
         """Show a custom notification window"""
+        import tkinter as tk
+        from tkinter import ttk
+        
         # Create a toplevel window
         notification_window = tk.Toplevel()
         notification_window.title("Event Reminder")
-        notification_window.geometry("300x150+50+50")  # Position near top-left
+        notification_window.geometry("+50+50")  # Position near top-left
+        notification_window.minsize(300, 150)  # Digests grow taller
         notification_window.attributes("-topmost", True)  # Keep on top
         
         # Make it look like a notification
@@ -0,0 +1,32 @@
+class Prefetcher:
+    """Loads the events of neighbouring periods ahead of time
+
+    Ranges are fetched on the AsyncDatabase thread without a callback. The
+    results land in the range cache of the DatabaseManager that all threads
+    share, so the views find a prefetched period there; a commit on any
+    thread drops the cached windows it touches. A newer request cancels the
+    ranges of an older one that have not started.
+    """
+
+    def __init__(self, async_db, columns=None):
+        """Initialize the prefetcher
+
+        columns is passed to fetch_events and must match what the views
+        ask for, so the prefetched results are found in the cache.
+        """
+        self.async_db = async_db
+        self.columns = columns
+
+        self._pending = []
+
+    def prefetch(self, ranges):
+        """Load a list of (start, end) ranges in the background"""
+        for future in self._pending:
+            future.cancel()
+
+        self._pending = [
+            self.async_db.submit(
+                "fetch_events", start_date, end_date, columns=self.columns
+            )
+            for start_date, end_date in ranges
+        ]
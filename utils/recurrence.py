@@ -0,0 +1,90 @@
+import calendar
+from datetime import datetime, timedelta
+
+TIME_FORMAT = "%Y-%m-%d %H:%M:%S"
+
+# Fixed-length recurrence steps; monthly and yearly are calendar based
+FIXED_STEPS = {
+    'daily': timedelta(days=1),
+    'weekly': timedelta(weeks=1),
+}
+
+MONTH_STEPS = {
+    'monthly': 1,
+    'yearly': 12,
+}
+
+
+def to_epoch(value):
+    """Convert a stored time, or a datetime, to integer epoch seconds
+
+    Stored times are wall-clock times without a zone. They are counted as
+    UTC, so the value does not depend on the machine's time zone or on DST
+    and matches SQLite's strftime('%s', ...).
+    """
+    if isinstance(value, str):
+        value = datetime.fromisoformat(value)
+    return calendar.timegm(value.timetuple())
+
+
+def occurrence_id(event_id, start_time):
+    """Build a stable identifier for one occurrence of an event
+
+    start_time is the occurrence start as stored in the database.
+    """
+    return f"{event_id}:{start_time}"
+
+
+def iter_occurrences(start, end, recurrence_type, recurrence_end,
+                     window_start, window_end):
+    """Yield (start, end) pairs of the occurrences overlapping a window
+
+    The first candidate is computed arithmetically from the window start,
+    so the cost is proportional to the number of occurrences in the window
+    rather than to the number since the series began. Monthly and yearly
+    series skip dates that do not exist (e.g. the 31st in April), as RFC 5545
+    does for RRULE expansion.
+    """
+    duration = end - start
+    # Occurrences starting before this instant end before the window opens
+    earliest_start = window_start - duration
+    last_start = window_end
+    if recurrence_end is not None and recurrence_end < last_start:
+        last_start = recurrence_end
+
+    if recurrence_type in FIXED_STEPS:
+        step = FIXED_STEPS[recurrence_type]
+        index = 0
+        if earliest_start > start:
+            # Ceiling division on timedeltas
+            index = -((start - earliest_start) // step)
+        occurrence = start + index * step
+        while occurrence <= last_start:
+            yield occurrence, occurrence + duration
+            occurrence += step
+    elif recurrence_type in MONTH_STEPS:
+        months = MONTH_STEPS[recurrence_type]
+        index = 0
+        if earliest_start > start:
+            elapsed = ((earliest_start.year - start.year) * 12
+                       + earliest_start.month - start.month)
+            index = max(0, elapsed // months - 1)
+        while True:
+            month_index = start.month - 1 + index * months
+            year = start.year + month_index // 12
+            month = month_index % 12 + 1
+            index += 1
+
+            if start.day > calendar.monthrange(year, month)[1]:
+                if datetime(year, month, 1) > last_start:
+                    break
+                continue
+
+            occurrence = start.replace(year=year, month=month)
+            if occurrence > last_start:
+                break
+            if occurrence >= earliest_start:
+                yield occurrence, occurrence + duration
+    elif start <= window_end and end >= window_start:
+        # Unknown recurrence types behave like a single event
+        yield start, end